@@ -1,6 +1,7 @@
 """AnyMoment Python SDK - API client and CLI for AnyMoment calendar service."""
 
-from anymoment.client import Client
+from typing import TYPE_CHECKING
+
 from anymoment.exceptions import (
     AnyMomentException,
     AuthenticationError,
@@ -9,12 +10,28 @@ from anymoment.exceptions import (
     ServerError,
 )
 
+if TYPE_CHECKING:
+    from anymoment.async_client import AsyncClient
+    from anymoment.client import Client
+
 __version__ = "0.1.0"
 __all__ = [
     "Client",
+    "AsyncClient",
     "AnyMomentException",
     "AuthenticationError",
     "NotFoundError",
     "ValidationError",
     "ServerError",
 ]
+
+
+def __getattr__(name: str):
+    # Import Client lazily so submodules (config, CLI) don't pull in requests/crypto
+    if name == "Client":
+        from anymoment.client import Client
+        return Client
+    if name == "AsyncClient":
+        from anymoment.async_client import AsyncClient
+        return AsyncClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,220 @@
+"""Asynchronous API client for AnyMoment SDK (requires the "async" extra)."""
+
+import asyncio
+from datetime import datetime
+from functools import partialmethod
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import httpx
+
+from anymoment import _json
+from anymoment.client import Client, _agenda_params, _only_set, _search_params
+from anymoment.config import get_api_url
+from anymoment.exceptions import AnyMomentException, AuthenticationError
+from anymoment.token_manager import get_token, save_token
+
+
+class AsyncClient:
+    """Asynchronous client for the AnyMoment API.
+    
+    Mirrors the read side of :class:`~anymoment.Client` and adds ``*_batch``
+    helpers that issue their requests concurrently. All requests share one
+    ``httpx.AsyncClient``; with HTTP/2 they are multiplexed over a single
+    connection, so N lookups cost about one round trip instead of N.
+    
+    Use it as an async context manager, or call :meth:`aclose` when done::
+        
+        async with AsyncClient() as client:
+            agendas = await client.get_agenda_batch([(start1, end1), (start2, end2)])
+    """
+    
+    DEFAULT_API_URL = Client.DEFAULT_API_URL
+    
+    def __init__(
+        self,
+        api_url: Optional[str] = None,
+        token: Optional[str] = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        http2: bool = True,
+        timeout: float = 30.0,
+    ):
+        """
+        Initialize the async API client.
+        
+        Args:
+            api_url: API base URL. Defaults to config/env or https://api.anymoment.sineways.tech
+            token: Optional JWT token. If not provided, will try to load from token manager.
+            max_connections: Max concurrent connections (default 100).
+            max_keepalive_connections: Max idle connections kept open (default 20).
+            http2: Negotiate HTTP/2 (default True).
+            timeout: Request timeout in seconds (default 30).
+        """
+        self.api_url = (api_url or get_api_url() or self.DEFAULT_API_URL).rstrip("/")
+        self._token = token or get_token(self.api_url)
+        headers = {"Content-Type": "application/json"}
+        if self._token:
+            headers["x-auth-token"] = self._token
+        self._session = httpx.AsyncClient(
+            base_url=self.api_url,
+            headers=headers,
+            http2=http2,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+        )
+        self._refresh_lock = asyncio.Lock()
+    
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        await self._session.aclose()
+    
+    async def _set_token(self, token: str) -> None:
+        """Set and save authentication token (the blocking file write runs in a worker thread)."""
+        self._token = token
+        self._session.headers["x-auth-token"] = token
+        await asyncio.to_thread(save_token, self.api_url, token)
+    
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+        json_data: Optional[dict[str, Any]] = None,
+        retry_on_auth_error: bool = True,
+    ) -> Any:
+        """Make an HTTP request to the API."""
+        body = None if json_data is None else _json.dumps(json_data)
+        sent_token = self._token
+        try:
+            response = await self._session.request(method, path, params=params, content=body)
+            
+            # Handle 401 with token refresh
+            if response.status_code == 401 and retry_on_auth_error:
+                try:
+                    async with self._refresh_lock:
+                        # Another task may have refreshed while we waited
+                        if self._token == sent_token:
+                            await self.refresh_token()
+                    response = await self._session.request(method, path, params=params, content=body)
+                except Exception:
+                    # Refresh failed, raise auth error
+                    pass
+            
+            return Client._handle_response(response)
+        except AnyMomentException:
+            raise
+        except httpx.HTTPError as e:
+            raise AnyMomentException(f"Request failed: {e}")
+    
+    _get = partialmethod(_request, "GET")
+    
+    async def refresh_token(self) -> str:
+        """
+        Refresh the current authentication token.
+        
+        Returns:
+            New JWT token string
+        """
+        if not self._token:
+            raise AuthenticationError("No token available to refresh")
+        
+        response = await self._session.get("/auth/token/extend")
+        if response.status_code == 200:
+            new_token = response.text.strip().strip('"')
+            await self._set_token(new_token)
+            return new_token
+        Client._handle_response(response)
+        return ""  # Should not reach here
+    
+    async def get_user_info(self) -> Dict[str, Any]:
+        """Get current user information."""
+        return await self._get("/auth/me")
+    
+    # Agenda methods
+    
+    async def get_agenda(
+        self,
+        start: Union[str, datetime],
+        end: Union[str, datetime],
+        calendar_ids: Optional[List[str]] = None,
+        use_cache: bool = True,
+        include_webhooks: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Get events and their instances within a time window (see Client.get_agenda)."""
+        params = _agenda_params(start, end, calendar_ids, use_cache, include_webhooks)
+        return await self._get("/agenda", params=params)
+    
+    async def get_agenda_batch(
+        self,
+        windows: Sequence[Tuple[Union[str, datetime], Union[str, datetime]]],
+        calendar_ids: Optional[List[str]] = None,
+        use_cache: bool = True,
+        include_webhooks: bool = False,
+    ) -> List[List[Dict[str, Any]]]:
+        """Fetch the agenda for several (start, end) windows concurrently, in order."""
+        return await asyncio.gather(*[
+            self.get_agenda(start, end, calendar_ids, use_cache, include_webhooks)
+            for start, end in windows
+        ])
+    
+    async def search_events(
+        self,
+        q: str,
+        start: Optional[Union[str, datetime]] = None,
+        end: Optional[Union[str, datetime]] = None,
+        calendar_ids: Optional[List[str]] = None,
+        is_active: Optional[bool] = None,
+        limit: int = 50,
+        offset: int = 0,
+        include_instances: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """Fuzzy search over events (see Client.search_events)."""
+        params = _search_params(q, start, end, calendar_ids, is_active, limit, offset, include_instances)
+        return await self._get("/agenda/search", params=params)
+    
+    # Event methods
+    
+    async def get_event(self, event_id: str) -> Dict[str, Any]:
+        """Get a specific event by ID."""
+        return await self._get(f"/events/{event_id}")
+    
+    async def get_events_batch(self, event_ids: Sequence[str]) -> List[Dict[str, Any]]:
+        """Fetch several events concurrently, in the order given."""
+        return await asyncio.gather(*[self.get_event(event_id) for event_id in event_ids])
+    
+    async def get_event_instances(
+        self,
+        event_id: str,
+        from_date: Optional[str] = None,
+        to_date: Optional[str] = None,
+        optimized: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Get event instances for a date range."""
+        params = _only_set(**{"from": from_date}, to=to_date, optimized="true" if optimized else None)
+        return await self._get(f"/events/{event_id}/instances", params=params)
+    
+    async def get_event_instances_batch(
+        self,
+        event_ids: Sequence[str],
+        from_date: Optional[str] = None,
+        to_date: Optional[str] = None,
+        optimized: bool = False,
+    ) -> List[List[Dict[str, Any]]]:
+        """Fetch instances for several events concurrently, in the order given."""
+        return await asyncio.gather(*[
+            self.get_event_instances(event_id, from_date, to_date, optimized)
+            for event_id in event_ids
+        ])
+    
+    async def get_next_event_instance(self, event_id: str) -> Dict[str, Any]:
+        """Get the next instance of an event."""
+        return await self._get(f"/events/{event_id}/next-instance")
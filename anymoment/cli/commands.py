@@ -1,33 +1,52 @@
 """CLI commands for AnyMoment."""
 
 import json
+import os
 import sys
-from datetime import date, datetime, time
-from typing import Any, Optional
+from datetime import date, datetime, time, timezone, tzinfo
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple
 
 import click
-from dateutil import tz as dateutil_tz
 
-from anymoment.client import Client
+try:
+    import orjson
+except ImportError:  # optional speedup, installed with the "fast" extra
+    orjson = None
+
 from anymoment.config import (
     get_api_url,
-    get_config,
     get_default_calendar_id,
     get_default_timezone,
+    load_config,
     set_config,
 )
 from anymoment.exceptions import AuthenticationError, AnyMomentException
-from anymoment.token_manager import (
-    clear_all_tokens,
-    delete_token,
-    get_token,
-    list_tokens,
-)
+
+# Client, token_manager and zoneinfo are imported inside the commands that need
+# them so `anymoment --help` doesn't load requests, cryptography or tzdata.
+
+# Built-in types captured before the `list` commands below shadow the name
+_LIST_T = list
+_DICT_T = dict
 
 
-def get_client(host=None, require_auth=True):
+def _get_cfg():
+    """Get the config dict for this CLI invocation (loaded once, shared via Click context)."""
+    ctx = click.get_current_context(silent=True)
+    if ctx is None:
+        return load_config()
+    if "anymoment.config" not in ctx.meta:
+        ctx.meta["anymoment.config"] = load_config()
+    return ctx.meta["anymoment.config"]
+
+
+def get_client(host=None, require_auth=True, cfg=None):
     """Get a configured client instance."""
-    api_url = host or get_api_url()
+    from anymoment.client import Client
+    from anymoment.token_manager import get_token
+    
+    api_url = host or get_api_url(cfg if cfg is not None else _get_cfg())
     client = Client(api_url=api_url)
     
     if require_auth:
@@ -41,122 +60,218 @@ def get_client(host=None, require_auth=True):
 
 def handle_api_error(e, context="Operation"):
     """Handle API errors with helpful messages."""
-    # Check exception type safely
-    try:
-        if isinstance(e, AuthenticationError):
-            click.echo(f"[ERROR] Authentication failed: {e.message}", err=True)
-            click.echo("   Run 'anymoment auth login' to authenticate.", err=True)
-            sys.exit(2)
-        elif isinstance(e, AnyMomentException):
-            click.echo(f"[ERROR] {context} failed: {e.message}", err=True)
-            if hasattr(e, 'details') and e.details:
-                for key, value in e.details.items():
-                    click.echo(f"   {key}: {value}", err=True)
-            sys.exit(1)
-        else:
-            click.echo(f"[ERROR] {context} failed: {str(e)}", err=True)
-            sys.exit(1)
-    except TypeError:
-        # Fallback if isinstance fails (shouldn't happen, but be safe)
+    if isinstance(e, AuthenticationError):
+        click.echo(f"[ERROR] Authentication failed: {e.message}", err=True)
+        click.echo("   Run 'anymoment auth login' to authenticate.", err=True)
+        sys.exit(2)
+    elif isinstance(e, AnyMomentException):
+        click.echo(f"[ERROR] {context} failed: {e.message}", err=True)
+        details = getattr(e, "details", None)
+        if details:
+            for key, value in details.items():
+                click.echo(f"   {key}: {value}", err=True)
+        sys.exit(1)
+    else:
         click.echo(f"[ERROR] {context} failed: {str(e)}", err=True)
         sys.exit(1)
 
 
-def format_output(data, raw=False, pipe=False):
-    """Format and output data with improved UX."""
-    # Import built-in types to avoid shadowing issues
-    import builtins
-    list_type = builtins.list
-    dict_type = builtins.dict
+class _JSONEncoder(json.JSONEncoder):
+    """Encode dates/datetimes as ISO 8601 (like orjson) and anything else via str()."""
     
-    if pipe:
-        # Output only IDs for piping/chaining
-        if isinstance(data, list_type):
-            for item in data:
-                if isinstance(item, dict_type):
-                    # Agenda/search items have nested "event"
-                    if "event" in item and isinstance(item.get("event"), dict_type):
-                        click.echo(item["event"].get("id", ""))
-                    else:
-                        click.echo(item.get("id", ""))
-                else:
-                    click.echo(str(item))
-        elif isinstance(data, dict_type):
-            click.echo(data.get("id", ""))
-        else:
-            click.echo(str(data))
-    elif raw:
-        # Output full JSON
-        click.echo(json.dumps(data, indent=2, default=str))
+    def default(self, o):
+        isoformat = getattr(o, "isoformat", None)
+        return isoformat() if isoformat is not None else str(o)
+
+
+_json_encoder = _JSONEncoder(indent=2)
+_json_encode = _json_encoder.encode
+
+
+def _dumps_json(data) -> bytes:
+    """Serialize data as indented JSON (UTF-8), using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            default=str,
+        )
+    return _json_encode(data).encode("utf-8")
+
+
+def _write_stdout_bytes(payload: bytes) -> None:
+    """Write already-encoded output to stdout in one call, bypassing click's text layer."""
+    stdout = getattr(sys.stdout, "buffer", None)
+    if stdout is None:
+        # Text-only stream (e.g. replaced sys.stdout): let click encode it
+        click.echo(payload.decode("utf-8"), nl=False)
+        return
+    sys.stdout.flush()
+    stdout.write(payload)
+    stdout.flush()
+
+
+def output_raw(data):
+    """Write data as indented JSON to stdout."""
+    if orjson is not None:
+        _write_stdout_bytes(_dumps_json(data) + b"\n")
+        return
+    # Stream the stdlib encoder's chunks instead of building one big string
+    stdout = sys.stdout
+    for chunk in _json_encoder.iterencode(data):
+        stdout.write(chunk)
+    stdout.write("\n")
+    stdout.flush()
+
+
+def _pipe_id(item) -> str:
+    """ID of a list item for pipe output; agenda/search items have a nested "event"."""
+    if isinstance(item, _DICT_T):
+        ev = item.get("event")
+        value = ev.get("id", "") if isinstance(ev, _DICT_T) else item.get("id", "")
+        return "" if value is None else str(value)
+    return str(item)
+
+
+def output_pipe(data):
+    """Write only IDs, one per line, for piping/chaining."""
+    if isinstance(data, _LIST_T):
+        if not data:
+            return
+        ids = [_pipe_id(item) for item in data]
+    elif isinstance(data, _DICT_T):
+        ids = [_pipe_id(data)]
     else:
-        # Human-readable format with better formatting
-        if isinstance(data, list_type):
-            if not data:
-                click.echo("No results found.")
-                return
-            
-            # Agenda/search items: event + instances (and optional score)
-            first = data[0] if data else None
-            if isinstance(first, dict_type) and "event" in first and isinstance(first.get("event"), dict_type):
-                for item in data:
-                    ev = item["event"]
-                    name = ev.get("display_name") or ev.get("name") or ev.get("id", "N/A")
-                    if "is_active" in ev:
-                        status = "[OK]" if ev["is_active"] else "[X]"
-                        name = f"{status} {name}"
-                    score = item.get("score")
-                    if score is not None:
-                        name = f"{name} (score: {score:.2f})"
-                    click.echo(f"  {name}")
-                    for inst in item.get("instances") or []:
-                        start_ts = inst.get("start") or ""
-                        end_ts = inst.get("end") or ""
-                        all_day = inst.get("is_all_day", False)
-                        suffix = " [all day]" if all_day else ""
-                        click.echo(f"    {start_ts} – {end_ts}{suffix}")
-                return
-            # Format as table for better readability
-            for idx, item in enumerate(data, 1):
-                if isinstance(item, dict_type):
-                    name = item.get("name", item.get("id", "N/A"))
-                    # Add status indicators
-                    if "is_active" in item:
-                        status = "[OK]" if item["is_active"] else "[X]"
-                        name = f"{status} {name}"
-                    # Add additional info if available
-                    if "event_count" in item:
-                        count = item["event_count"]
-                        click.echo(f"  {name} ({count} events)")
-                    elif "timezone" in item:
-                        tz = item.get("timezone", "UTC")
-                        click.echo(f"  {name} [{tz}]")
-                    else:
-                        click.echo(f"  {name}")
-                else:
-                    click.echo(f"  {item}")
-        elif isinstance(data, dict_type):
-            # Pretty print dictionary with better formatting
-            for key, value in data.items():
-                if key == "id":
-                    continue  # Skip ID in detailed view
-                # Check if value is dict or list - check each type separately for compatibility
-                if isinstance(value, dict_type) or isinstance(value, list_type):
-                    if value:  # Only show non-empty collections
-                        click.echo(f"\n{key.replace('_', ' ').title()}:")
-                        format_output(value, raw=False, pipe=False)
-                elif value is not None:
-                    # Format key nicely
-                    display_key = key.replace('_', ' ').title()
-                    # Check bool type safely
-                    if type(value) == bool:
-                        display_value = "Yes" if value else "No"
-                    elif isinstance(value, str) and len(value) > 60:
-                        display_value = value[:57] + "..."
-                    else:
-                        display_value = str(value)
-                    click.echo(f"  {display_key}: {display_value}")
+        ids = [str(data)]
+    _write_stdout_bytes(("\n".join(ids) + "\n").encode("utf-8"))
+
+
+def _fmt_list(data, out):
+    """Format a list as one summary row per item."""
+    if not data:
+        out.append("No results found.")
+        return
+    
+    # Agenda/search items: event + instances (and optional score)
+    first = data[0]
+    if isinstance(first, _DICT_T) and "event" in first and isinstance(first.get("event"), _DICT_T):
+        # Agenda dumps can be large: bind hot methods to locals once
+        append = out.append
+        for item in data:
+            item_get = item.get
+            ev = item["event"]
+            ev_get = ev.get
+            name = ev_get("display_name") or ev_get("name") or ev_get("id", "N/A")
+            if "is_active" in ev:
+                status = "[OK]" if ev["is_active"] else "[X]"
+                name = f"{status} {name}"
+            score = item_get("score")
+            if score is not None:
+                name = f"{name} (score: {score:.2f})"
+            append(f"  {name}")
+            for inst in item_get("instances") or ():
+                inst_get = inst.get
+                suffix = " [all day]" if inst_get("is_all_day", False) else ""
+                append(f"    {inst_get('start') or ''} – {inst_get('end') or ''}{suffix}")
+        return
+    
+    # Format as table for better readability; one row per item, so the
+    # rows are built first and added with a single (pre-sized) extend
+    out.extend([_summary_row(item) for item in data])
+
+
+def _summary_row(item):
+    """One table row for a list item (calendar, event, ...)."""
+    if not isinstance(item, _DICT_T):
+        return f"  {item}"
+    name = item.get("name", item.get("id", "N/A"))
+    # Add status indicators
+    if "is_active" in item:
+        status = "[OK]" if item["is_active"] else "[X]"
+        name = f"{status} {name}"
+    # Add additional info if available
+    if "event_count" in item:
+        count = item["event_count"]
+        return f"  {name} ({count} events)"
+    if "timezone" in item:
+        tz = item.get("timezone", "UTC")
+        return f"  {name} [{tz}]"
+    return f"  {name}"
+
+
+@lru_cache(maxsize=256)
+def _display_key(key: str) -> str:
+    """Format an API field name for display (e.g. "event_count" -> "Event Count")."""
+    return key.replace("_", " ").title()
+
+
+def _fmt_dict(data, out):
+    """Format a dict as one "Key: value" line per field."""
+    for key, value in data.items():
+        if key == "id":
+            continue  # Skip ID in detailed view
+        if isinstance(value, (_DICT_T, _LIST_T)):
+            if value:  # Only show non-empty collections
+                out.append(f"\n{_display_key(key)}:")
+                output_human(value, out=out)
+        elif value is not None:
+            display_key = _display_key(key)
+            if value is True or value is False:
+                display_value = "Yes" if value else "No"
+            elif isinstance(value, str) and len(value) > 60:
+                display_value = value[:57] + "..."
+            else:
+                display_value = str(value)
+            out.append(f"  {display_key}: {display_value}")
+
+
+def _fmt_scalar(data, out):
+    """Format anything else as its string form."""
+    out.append(str(data))
+
+
+_HANDLERS = {_LIST_T: _fmt_list, _DICT_T: _fmt_dict}
+
+
+def output_human(data, out=None):
+    """Write data in human-readable form.
+    
+    Lines are collected into ``out``; the top-level call (``out=None``) writes
+    them with a single echo instead of one write per line.
+    """
+    if out is None:
+        buf = []
+        output_human(data, out=buf)
+        if buf:
+            click.echo("\n".join(buf))
+        return
+    
+    handler = _HANDLERS.get(type(data))
+    if handler is None:
+        # Subclasses of list/dict miss the exact-type lookup
+        if isinstance(data, _LIST_T):
+            handler = _fmt_list
+        elif isinstance(data, _DICT_T):
+            handler = _fmt_dict
         else:
-            click.echo(str(data))
+            handler = _fmt_scalar
+    handler(data, out)
+
+
+# Options shared across commands
+_host_opt = click.option("--host", "-h", default=None, help="API host URL")
+_raw_opt = click.option("--raw", is_flag=True, help="Output full JSON")
+_pipe_opt = click.option("--pipe", is_flag=True, help="Output only IDs")
+
+
+def _list_opts(f):
+    """Apply --host, --raw and --pipe (for commands returning lists)."""
+    return _host_opt(_raw_opt(_pipe_opt(f)))
+
+
+def format_output(data, raw=False, pipe=False):
+    """Format and output data with improved UX (IDs only with pipe, JSON with raw)."""
+    (output_pipe if pipe else output_raw if raw else output_human)(data)
 
 
 @click.group()
@@ -173,18 +288,25 @@ def auth():
 
 
 @auth.command()
-@click.option("--host", "-h", default=None, help="API host URL")
+@_host_opt
 def login(host):
-    """Interactive login (prompts for email/password)."""
+    """Interactive login (prompts for email/password).
+    
+    Set ANYMOMENT_EMAIL / ANYMOMENT_PASSWORD to skip the prompts (e.g. in CI).
+    """
+    from anymoment.client import Client
+    
     api_url = host or get_api_url()
     click.echo(f"Logging in to {api_url}...")
     
-    email = click.prompt("Email", type=str, default=None)
+    email = os.getenv("ANYMOMENT_EMAIL") or click.prompt("Email", type=str, default=None)
     if not email:
         click.echo("[ERROR] Email is required.", err=True)
         sys.exit(1)
     
-    password = click.prompt("Password", type=str, hide_input=True, default=None)
+    password = os.getenv("ANYMOMENT_PASSWORD") or click.prompt(
+        "Password", type=str, hide_input=True, default=None
+    )
     if not password:
         click.echo("[ERROR] Password is required.", err=True)
         sys.exit(1)
@@ -203,9 +325,11 @@ def login(host):
 
 
 @auth.command()
-@click.option("--host", "-h", default=None, help="API host URL")
+@_host_opt
 def logout(host):
     """Clear cached token for host."""
+    from anymoment.token_manager import delete_token
+    
     api_url = host or get_api_url()
     delete_token(api_url)
     click.echo(f"[OK] Logged out from {api_url}")
@@ -220,13 +344,14 @@ def tokens():
 @tokens.command()
 def list():
     """Show all cached tokens with expiry status."""
+    from anymoment.token_manager import list_tokens
+    
     tokens = list_tokens()
     if not tokens:
-        click.echo("No tokens found.")
-        click.echo("  Run 'anymoment auth login' to authenticate.")
+        click.echo("No tokens found.\n  Run 'anymoment auth login' to authenticate.")
         return
     
-    click.echo("Cached tokens:\n")
+    lines = ["Cached tokens:\n"]
     for host_url, info in tokens.items():
         if info.get("invalid"):
             status_icon = "[X]"
@@ -239,18 +364,21 @@ def list():
             status_text = "valid"
         
         expires = info["expires_at"] or "never"
-        click.echo(f"  {status_icon} {host_url}")
-        click.echo(f"    Status: {status_text}")
-        click.echo(f"    Expires: {expires}")
+        lines.append(f"  {status_icon} {host_url}")
+        lines.append(f"    Status: {status_text}")
+        lines.append(f"    Expires: {expires}")
         
         if info.get("invalid"):
-            click.echo(f"    Note: Token appears to be invalid. Please login again.")
-        click.echo()
+            lines.append("    Note: Token appears to be invalid. Please login again.")
+        lines.append("")
+    click.echo("\n".join(lines))
 
 
 @tokens.command()
 def clear():
     """Clear all cached tokens."""
+    from anymoment.token_manager import clear_all_tokens
+    
     clear_all_tokens()
     click.echo("[OK] All tokens cleared")
 
@@ -291,13 +419,15 @@ def set_calendar(calendar_id: str):
 @config.command()
 def show():
     """Display current configuration."""
+    cfg = _get_cfg()
     config = {
-        "default_api_url": get_config("default_api_url") or "https://api.anymoment.sineways.tech",
-        "default_timezone": get_config("default_timezone") or "UTC",
-        "default_calendar_id": get_config("default_calendar_id") or "(not set)",
+        "default_api_url": cfg.get("default_api_url") or "https://api.anymoment.sineways.tech",
+        "default_timezone": cfg.get("default_timezone") or "UTC",
+        "default_calendar_id": cfg.get("default_calendar_id") or "(not set)",
     }
-    click.echo("Current configuration:\n")
-    format_output(config)
+    lines = ["Current configuration:\n"]
+    output_human(config, out=lines)
+    click.echo("\n".join(lines))
 
 
 @cli.group()
@@ -310,9 +440,7 @@ def calendars():
 @click.option("--active/--inactive", default=None, help="Filter by active status")
 @click.option("--limit", "-l", type=int, help="Maximum number of results")
 @click.option("--offset", "-s", type=int, help="Number of results to skip")
-@click.option("--host", "-h", help="API host URL")
-@click.option("--raw", is_flag=True, help="Output full JSON")
-@click.option("--pipe", is_flag=True, help="Output only IDs")
+@_list_opts
 def list(active, limit, offset, host, raw, pipe):
     """List calendars."""
     try:
@@ -334,14 +462,15 @@ def list(active, limit, offset, host, raw, pipe):
 @click.option("--description", help="Calendar description")
 @click.option("--timezone", "-z", default=None, help="Calendar timezone (defaults to config or UTC)")
 @click.option("--color", help="Calendar color")
-@click.option("--host", "-h", help="API host URL")
-@click.option("--raw", is_flag=True, help="Output full JSON")
+@_host_opt
+@_raw_opt
 def create(name, description, timezone, color, host, raw):
     """Create a new calendar."""
     try:
-        client = get_client(host)
+        cfg = _get_cfg()
+        client = get_client(host, cfg=cfg)
         # Use default timezone from config if not provided
-        tz = timezone or get_default_timezone()
+        tz = timezone or get_default_timezone(cfg)
         calendar = client.create_calendar(
             name=name,
             description=description,
@@ -359,8 +488,8 @@ def create(name, description, timezone, color, host, raw):
 
 @calendars.command()
 @click.argument("calendar_id")
-@click.option("--host", "-h", help="API host URL")
-@click.option("--raw", is_flag=True, help="Output full JSON")
+@_host_opt
+@_raw_opt
 def get(calendar_id, host, raw):
     """Get calendar details."""
     try:
@@ -378,8 +507,8 @@ def get(calendar_id, host, raw):
 @click.option("--timezone", "-z", help="Calendar timezone")
 @click.option("--color", help="Calendar color")
 @click.option("--active/--inactive", default=None, help="Active status")
-@click.option("--host", "-h", help="API host URL")
-@click.option("--raw", is_flag=True, help="Output full JSON")
+@_host_opt
+@_raw_opt
 def update(calendar_id, name, description, timezone, color, active, host, raw):
     """Update a calendar."""
     try:
@@ -401,7 +530,7 @@ def update(calendar_id, name, description, timezone, color, active, host, raw):
 
 @calendars.command()
 @click.argument("calendar_id")
-@click.option("--host", "-h", help="API host URL")
+@_host_opt
 def delete(calendar_id, host):
     """Delete a calendar."""
     try:
@@ -416,8 +545,8 @@ def delete(calendar_id, host):
 @click.argument("calendar_id")
 @click.argument("user_id")
 @click.option("--role", default="viewer", help="Role: owner, editor, viewer")
-@click.option("--host", "-h", help="API host URL")
-@click.option("--raw", is_flag=True, help="Output full JSON")
+@_host_opt
+@_raw_opt
 def share(calendar_id, user_id, role, host, raw):
     """Share a calendar with another user."""
     try:
@@ -432,8 +561,8 @@ def share(calendar_id, user_id, role, host, raw):
 
 @calendars.command()
 @click.argument("calendar_id")
-@click.option("--host", "-h", help="API host URL")
-@click.option("--raw", is_flag=True, help="Output full JSON")
+@_host_opt
+@_raw_opt
 def webhook_url(calendar_id, host, raw):
     """Generate webhook URL for a calendar."""
     try:
@@ -452,8 +581,8 @@ def webhook_url(calendar_id, host, raw):
 @click.argument("event_id")
 @click.option("--display-order", type=int, help="Display order")
 @click.option("--color", help="Color override")
-@click.option("--host", "-h", help="API host URL")
-@click.option("--raw", is_flag=True, help="Output full JSON")
+@_host_opt
+@_raw_opt
 def add_event(calendar_id, event_id, display_order, color, host, raw):
     """Add an event to a calendar (link)."""
     try:
@@ -474,7 +603,7 @@ def add_event(calendar_id, event_id, display_order, color, host, raw):
 @calendars.command("remove-event")
 @click.argument("calendar_id")
 @click.argument("event_id")
-@click.option("--host", "-h", help="API host URL")
+@_host_opt
 def remove_event(calendar_id, event_id, host):
     """Remove an event from a calendar (unlink; event is not deleted)."""
     try:
@@ -490,15 +619,15 @@ def remove_event(calendar_id, event_id, host):
 @click.argument("event_ids", nargs=-1, required=True)
 @click.option("--display-order", type=int, help="Display order for all")
 @click.option("--color", help="Color override for all")
-@click.option("--host", "-h", help="API host URL")
-@click.option("--raw", is_flag=True, help="Output full JSON")
+@_host_opt
+@_raw_opt
 def batch_add_events(calendar_id, event_ids, display_order, color, host, raw):
     """Add multiple events to a calendar in one request."""
     try:
         client = get_client(host)
         result = client.batch_add_events_to_calendar(
             calendar_id=calendar_id,
-            event_ids=list(event_ids),
+            event_ids=_LIST_T(event_ids),
             display_order=display_order,
             color_override=color,
         )
@@ -512,14 +641,14 @@ def batch_add_events(calendar_id, event_ids, display_order, color, host, raw):
 @calendars.command("batch-remove-events")
 @click.argument("calendar_id")
 @click.argument("event_ids", nargs=-1, required=True)
-@click.option("--host", "-h", help="API host URL")
+@_host_opt
 def batch_remove_events(calendar_id, event_ids, host):
     """Remove multiple events from a calendar (unlink only)."""
     try:
         client = get_client(host)
         result = client.batch_remove_events_from_calendar(
             calendar_id=calendar_id,
-            event_ids=list(event_ids),
+            event_ids=_LIST_T(event_ids),
         )
         if result:
             count = result.get("count", len(event_ids))
@@ -532,8 +661,8 @@ def batch_remove_events(calendar_id, event_ids, host):
 @click.argument("calendar_id")
 @click.argument("user_id")
 @click.option("--role", required=True, help="New role: owner, editor, viewer")
-@click.option("--host", "-h", help="API host URL")
-@click.option("--raw", is_flag=True, help="Output full JSON")
+@_host_opt
+@_raw_opt
 def update_share(calendar_id, user_id, role, host, raw):
     """Update a shared user's role for a calendar."""
     try:
@@ -549,8 +678,8 @@ def update_share(calendar_id, user_id, role, host, raw):
 @calendars.command()
 @click.argument("calendar_id")
 @click.argument("user_id")
-@click.option("--host", "-h", help="API host URL")
-@click.option("--raw", is_flag=True, help="Output full JSON")
+@_host_opt
+@_raw_opt
 def unshare(calendar_id, user_id, host, raw):
     """Remove an AnyMoment share for a calendar (user loses access unless linked via Google)."""
     try:
@@ -563,22 +692,37 @@ def unshare(calendar_id, user_id, host, raw):
         handle_api_error(e, "Unshare calendar")
 
 
-def _default_agenda_start_iso() -> str:
-    """Default agenda window start: today 00:00 in default timezone, as UTC ISO."""
-    tz_str = get_default_timezone()
-    tz_obj = dateutil_tz.gettz(tz_str) or dateutil_tz.UTC
-    start = datetime.combine(date.today(), time.min, tzinfo=tz_obj)
-    utc = start.astimezone(dateutil_tz.UTC)
-    return utc.strftime("%Y-%m-%dT%H:%M:%S") + "Z"
+def _parse_csv_ids(value: Optional[str]) -> Optional[List[str]]:
+    """Split a comma-separated ID option into a list, dropping blanks; None if unset."""
+    if not value:
+        return None
+    return [t for t in map(str.strip, value.split(",")) if t]
+
+
+@lru_cache(maxsize=32)
+def _tz(name: str) -> tzinfo:
+    """Resolve an IANA timezone name, falling back to UTC if unknown."""
+    from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+    
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError, OSError):
+        # OSError: some Python versions raise IsADirectoryError for names like "America"
+        return timezone.utc
+
+
+@lru_cache(maxsize=16)
+def _agenda_bounds(tz_name: str, day: date) -> Tuple[str, str]:
+    """Start (00:00) and end (23:59:59) of ``day`` in ``tz_name``, as UTC ISO strings."""
+    tz_obj = _tz(tz_name)
+    start = datetime.combine(day, time.min, tzinfo=tz_obj).astimezone(timezone.utc)
+    end = datetime.combine(day, time(23, 59, 59), tzinfo=tz_obj).astimezone(timezone.utc)
+    return start.strftime("%Y-%m-%dT%H:%M:%SZ"), end.strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
-def _default_agenda_end_iso() -> str:
-    """Default agenda window end: today 23:59:59 in default timezone, as UTC ISO."""
-    tz_str = get_default_timezone()
-    tz_obj = dateutil_tz.gettz(tz_str) or dateutil_tz.UTC
-    end = datetime.combine(date.today(), time(23, 59, 59), tzinfo=tz_obj)
-    utc = end.astimezone(dateutil_tz.UTC)
-    return utc.strftime("%Y-%m-%dT%H:%M:%S") + "Z"
+def _default_agenda_window(cfg=None) -> Tuple[str, str]:
+    """Default agenda window: today in the default timezone, as UTC ISO."""
+    return _agenda_bounds(get_default_timezone(cfg), date.today())
 
 
 @cli.group()
@@ -593,16 +737,19 @@ def agenda():
 @click.option("--calendar", "-c", default=None, help="Restrict to calendar ID(s); comma-separated for multiple")
 @click.option("--no-cache", is_flag=True, help="Do not use instance cache")
 @click.option("--webhooks", is_flag=True, help="Include webhooks in event payloads")
-@click.option("--host", "-h", help="API host URL")
-@click.option("--raw", is_flag=True, help="Output full JSON")
+@_host_opt
+@_raw_opt
 @click.option("--pipe", is_flag=True, help="Output only event IDs")
 def agenda_list(start, end, calendar, no_cache, webhooks, host, raw, pipe):
     """List events and instances in a time window (agenda)."""
     try:
-        start_iso = start if start is not None else _default_agenda_start_iso()
-        end_iso = end if end is not None else _default_agenda_end_iso()
-        calendar_ids = [x.strip() for x in calendar.split(",")] if calendar else None
-        client = get_client(host)
+        cfg = _get_cfg()
+        if start is None or end is None:
+            default_start, default_end = _default_agenda_window(cfg)
+        start_iso = start if start is not None else default_start
+        end_iso = end if end is not None else default_end
+        calendar_ids = _parse_csv_ids(calendar)
+        client = get_client(host, cfg=cfg)
         items = client.get_agenda(
             start=start_iso,
             end=end_iso,
@@ -626,13 +773,13 @@ def agenda_list(start, end, calendar, no_cache, webhooks, host, raw, pipe):
 @click.option("--limit", "-l", type=int, default=50, help="Max results (1-100)")
 @click.option("--offset", type=int, default=0, help="Skip this many results")
 @click.option("--no-instances", is_flag=True, help="Do not include instances in response when using --start/--end")
-@click.option("--host", "-h", help="API host URL")
-@click.option("--raw", is_flag=True, help="Output full JSON")
+@_host_opt
+@_raw_opt
 @click.option("--pipe", is_flag=True, help="Output only event IDs")
 def agenda_search(query, start, end, calendar, active, limit, offset, no_instances, host, raw, pipe):
     """Fuzzy search events by name (optional time window and filters)."""
     try:
-        calendar_ids = [x.strip() for x in calendar.split(",")] if calendar else None
+        calendar_ids = _parse_csv_ids(calendar)
         client = get_client(host)
         items = client.search_events(
             q=query,
@@ -664,17 +811,18 @@ def events():
 @click.option("--timezone", "-z", default=None, help="Event timezone (defaults to config or UTC)")
 @click.option("--calendar", "-c", default=None, help="Calendar ID (defaults to config default)")
 @click.option("--model", default="high", type=click.Choice(["high", "low", "mega"]), help="Model: high, low, mega")
-@click.option("--host", "-h", help="API host URL")
-@click.option("--raw", is_flag=True, help="Output full JSON")
+@_host_opt
+@_raw_opt
 def create(
     text, name, description, timezone, calendar, model, host, raw
 ):
     """Create an event from natural language."""
     try:
-        client = get_client(host)
+        cfg = _get_cfg()
+        client = get_client(host, cfg=cfg)
         # Use defaults from config if not provided
-        tz = timezone or get_default_timezone()
-        cal_id = calendar or get_default_calendar_id()
+        tz = timezone or get_default_timezone(cfg)
+        cal_id = calendar or get_default_calendar_id(cfg)
         
         # Don't show calendar ID if using default - it's expected behavior
         
@@ -701,15 +849,14 @@ def create(
 @click.option("--limit", "-l", type=int, help="Maximum number of results")
 @click.option("--offset", "-s", type=int, help="Number of results to skip")
 @click.option("--minimal", is_flag=True, help="Return minimal event data")
-@click.option("--host", "-h", help="API host URL")
-@click.option("--raw", is_flag=True, help="Output full JSON")
-@click.option("--pipe", is_flag=True, help="Output only IDs")
+@_list_opts
 def list(calendar, active, limit, offset, minimal, host, raw, pipe):
     """List events."""
     try:
-        client = get_client(host)
+        cfg = _get_cfg()
+        client = get_client(host, cfg=cfg)
         # Use default calendar from config if not provided
-        cal_id = calendar or get_default_calendar_id()
+        cal_id = calendar or get_default_calendar_id(cfg)
         
         events = client.list_events(
             calendar_id=cal_id,
@@ -727,8 +874,8 @@ def list(calendar, active, limit, offset, minimal, host, raw, pipe):
 
 @events.command()
 @click.argument("event_id")
-@click.option("--host", "-h", help="API host URL")
-@click.option("--raw", is_flag=True, help="Output full JSON")
+@_host_opt
+@_raw_opt
 def get(event_id, host, raw):
     """Get event details."""
     try:
@@ -743,8 +890,8 @@ def get(event_id, host, raw):
 @click.argument("event_id")
 @click.option("--name", help="Event name")
 @click.option("--description", help="Event description")
-@click.option("--host", "-h", help="API host URL")
-@click.option("--raw", is_flag=True, help="Output full JSON")
+@_host_opt
+@_raw_opt
 def update(event_id, name, description, host, raw):
     """Update an event."""
     try:
@@ -759,7 +906,7 @@ def update(event_id, name, description, host, raw):
 
 @events.command()
 @click.argument("event_id")
-@click.option("--host", "-h", help="API host URL")
+@_host_opt
 def delete(event_id, host):
     """Delete an event."""
     try:
@@ -772,8 +919,8 @@ def delete(event_id, host):
 
 @events.command()
 @click.argument("event_id")
-@click.option("--host", "-h", help="API host URL")
-@click.option("--raw", is_flag=True, help="Output full JSON")
+@_host_opt
+@_raw_opt
 def toggle(event_id, host, raw):
     """Toggle event active status."""
     try:
@@ -792,8 +939,8 @@ def toggle(event_id, host, raw):
 @click.option("--from", "from_date", help="Start date")
 @click.option("--to", "to_date", help="End date")
 @click.option("--optimized", is_flag=True, help="Return optimized format")
-@click.option("--host", "-h", help="API host URL")
-@click.option("--raw", is_flag=True, help="Output full JSON")
+@_host_opt
+@_raw_opt
 def instances(event_id, from_date, to_date, optimized, host, raw):
     """Get event instances for a date range."""
     try:
@@ -813,8 +960,8 @@ def instances(event_id, from_date, to_date, optimized, host, raw):
 
 @events.command()
 @click.argument("event_id")
-@click.option("--host", "-h", help="API host URL")
-@click.option("--raw", is_flag=True, help="Output full JSON")
+@_host_opt
+@_raw_opt
 def next(event_id, host, raw):
     """Get the next instance of an event."""
     try:
@@ -834,7 +981,7 @@ def next(event_id, host, raw):
 @click.option("--from", "from_date", help="Start date")
 @click.option("--to", "to_date", help="End date")
 @click.option("--out", "output_file", help="Output file path")
-@click.option("--host", "-h", help="API host URL")
+@_host_opt
 def export(event_id, format_type, from_date, to_date, output_file, host):
     """Export event instances (ICS/CSV formats)."""
     try:
@@ -847,11 +994,17 @@ def export(event_id, format_type, from_date, to_date, output_file, host):
         
         # For now, just output JSON - full ICS/CSV export can be added later
         if output_file:
-            with open(output_file, "w") as f:
-                json.dump(instances, f, indent=2, default=str)
+            if orjson is not None:
+                with open(output_file, "wb", buffering=1 << 20) as f:
+                    f.write(_dumps_json(instances))
+            else:
+                # Stream the stdlib encoder's chunks; a large buffer coalesces its small writes
+                with open(output_file, "w", encoding="utf-8", buffering=1 << 20) as f:
+                    for chunk in _json_encoder.iterencode(instances):
+                        f.write(chunk)
             click.echo(f"[OK] Exported {len(instances)} instance(s) to {output_file}")
         else:
-            format_output(instances, raw=True)
+            output_raw(instances)
     except Exception as e:
         handle_api_error(e, "Export events")
 
@@ -863,8 +1016,8 @@ def users():
 
 
 @users.command()
-@click.option("--host", "-h", help="API host URL")
-@click.option("--raw", is_flag=True, help="Output full JSON")
+@_host_opt
+@_raw_opt
 def me(host, raw):
     """Show current user info."""
     try:
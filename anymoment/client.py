@@ -1,10 +1,17 @@
 """API client for AnyMoment SDK."""
 
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Union
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from functools import partialmethod, singledispatch
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from anymoment import _json
 from anymoment.config import get_api_url
 from anymoment.exceptions import (
     AnyMomentException,
@@ -15,77 +22,365 @@ from anymoment.exceptions import (
 )
 from anymoment.token_manager import get_token, save_token
 
+# Transient statuses worth retrying; non-idempotent requests only retry when
+# the server signals it did not process them
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+_RETRY_STATUSES_UNSAFE = frozenset({429, 503})
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+# Query-string form of booleans; requests would otherwise send "True"/"False".
+_BOOL_PARAM = {True: "true", False: "false"}
+_STATUS_EXC = {401: AuthenticationError, 404: NotFoundError, 400: ValidationError}
+_NOT_JSON = object()
+
+
+@singledispatch
+def _to_iso(value: Union[str, datetime]) -> str:
+    """Serialize start/end for agenda/search: datetime (naive=UTC) or str to ISO."""
+    raise TypeError("start/end must be str (ISO 8601) or datetime")
+
+
+@_to_iso.register
+def _(value: str) -> str:
+    return value
+
+
+@_to_iso.register
+def _(value: datetime) -> str:
+    return (value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)).isoformat()
+
+
+def _to_datetime(value: Union[str, datetime]) -> datetime:
+    """Parse an ISO 8601 string (or take a datetime) as an aware datetime; naive = UTC."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    elif not isinstance(value, datetime):
+        raise TypeError("start/end must be str (ISO 8601) or datetime")
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+def _only_set(**kwargs: Any) -> Dict[str, Any]:
+    """Keep only the arguments that were given (not None), for params and JSON bodies."""
+    return {k: v for k, v in kwargs.items() if v is not None}
+
+
+def _agenda_params(
+    start: Union[str, datetime],
+    end: Union[str, datetime],
+    calendar_ids: Optional[List[str]],
+    use_cache: bool,
+    include_webhooks: bool,
+) -> Dict[str, Any]:
+    """Query params for GET /agenda (shared by Client and AsyncClient)."""
+    return _only_set(
+        start=_to_iso(start),
+        end=_to_iso(end),
+        use_cache=_BOOL_PARAM[use_cache],
+        include_webhooks=_BOOL_PARAM[include_webhooks],
+        calendar_ids=calendar_ids,
+    )
+
+
+def _search_params(
+    q: str,
+    start: Optional[Union[str, datetime]],
+    end: Optional[Union[str, datetime]],
+    calendar_ids: Optional[List[str]],
+    is_active: Optional[bool],
+    limit: int,
+    offset: int,
+    include_instances: bool,
+) -> Dict[str, Any]:
+    """Query params for GET /agenda/search (shared by Client and AsyncClient)."""
+    return _only_set(
+        q=q.strip(),
+        limit=limit,
+        offset=offset,
+        include_instances=_BOOL_PARAM[include_instances],
+        start=None if start is None else _to_iso(start),
+        end=None if end is None else _to_iso(end),
+        calendar_ids=calendar_ids,
+        is_active=_BOOL_PARAM.get(is_active),
+    )
+
+
+class _CircuitBreaker:
+    """Fail fast after repeated server/connection failures.
+    
+    CLOSED: requests flow. After ``failure_threshold`` consecutive failures it
+    goes OPEN and rejects requests for ``recovery_timeout`` seconds, then
+    HALF_OPEN lets a single probe through (other callers are rejected until it
+    is recorded): success closes it, failure re-opens it.
+    """
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+        self._lock = threading.Lock()
+    
+    def allow(self) -> bool:
+        """Whether a request may be sent now."""
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self.opened_at < self.recovery_timeout:
+                    return False
+                self.state = self.HALF_OPEN
+            if self.state == self.HALF_OPEN:
+                if self.probe_in_flight:
+                    return False
+                self.probe_in_flight = True
+            return True
+    
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self.probe_in_flight = False
+    
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            self.probe_in_flight = False
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+    
+    def release_probe(self) -> None:
+        """Let the next caller probe again when a probe ended without a recordable outcome."""
+        with self._lock:
+            self.probe_in_flight = False
+
+
+class _HTTP2Session:
+    """Minimal requests.Session stand-in over httpx.Client, used for Client(http2=True).
+    
+    Exposes only what Client uses (headers, request/get/post) and maps httpx
+    errors onto the requests exceptions Client already handles.
+    """
+    
+    def __init__(self, pool_size: int, max_retries: int):
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError("Client(http2=True) requires httpx; install anymoment[async]") from e
+        self._httpx = httpx
+        limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+        # httpx retries connection failures only, like the urllib3 connect retries
+        transport = httpx.HTTPTransport(http2=True, retries=max(max_retries, 0), limits=limits)
+        self._client = httpx.Client(transport=transport)
+    
+    @property
+    def headers(self):
+        return self._client.headers
+    
+    def request(self, method, url, params=None, data=None, headers=None, timeout=None):
+        httpx = self._httpx
+        request = self._client.build_request(method, url, params=params, content=data, timeout=timeout)
+        # requests drops headers set to None; do the same
+        for name, value in (headers or {}).items():
+            if value is None:
+                request.headers.pop(name, None)
+            else:
+                request.headers[name] = value
+        try:
+            return self._client.send(request)
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(e) from e
+        except (httpx.RemoteProtocolError, httpx.ReadError, httpx.TransportError) as e:
+            # Dropped streams and reset connections are transport failures for
+            # the retry logic and circuit breaker, like a refused connect
+            raise requests.exceptions.ConnectionError(e) from e
+        except httpx.HTTPError as e:
+            raise requests.exceptions.RequestException(e) from e
+    
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+    
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
 
 class Client:
     """Client for interacting with the AnyMoment API."""
     
     DEFAULT_API_URL = "https://api.anymoment.sineways.tech"
     
-    def __init__(self, api_url: Optional[str] = None, token: Optional[str] = None):
+    def __init__(
+        self,
+        api_url: Optional[str] = None,
+        token: Optional[str] = None,
+        pool_size: int = 20,
+        max_retries: int = 3,
+        base_backoff: float = 0.1,
+        max_backoff: float = 10.0,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        http2: bool = False,
+    ):
         """
         Initialize the API client.
         
+        A client may be shared between threads: requests go through one
+        ``requests.Session`` whose connection pool keeps up to ``pool_size``
+        keep-alive connections per host, so concurrent calls reuse
+        connections instead of opening (and TLS-handshaking) new ones.
+        
         Args:
             api_url: API base URL. Defaults to config/env or https://api.anymoment.sineways.tech
             token: Optional JWT token. If not provided, will try to load from token manager.
+            pool_size: Max pooled connections per host (default 20).
+            max_retries: Retries for transient failures: 429/502/503/504 responses
+                (in the client) and connection errors/timeouts (in urllib3).
+                Read errors are only retried for idempotent methods. 0 disables
+                retrying.
+            base_backoff: Base delay in seconds for exponential backoff with full jitter.
+            max_backoff: Upper bound in seconds for a single backoff delay.
+            failure_threshold: Consecutive 5xx/connection failures (after retries)
+                before further calls fail fast with ServerError.
+            recovery_timeout: Seconds to fail fast before probing the API again.
+            http2: Send requests over HTTP/2 via httpx (requires anymoment[async]).
+                Threads sharing the client then multiplex on one connection.
         """
         self.api_url = api_url or get_api_url() or self.DEFAULT_API_URL
         self.api_url = self.api_url.rstrip("/")
         self._token = token
-        self._session = requests.Session()
+        self.max_retries = max_retries
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self._breaker = _CircuitBreaker(failure_threshold, recovery_timeout)
+        if http2:
+            self._session = _HTTP2Session(pool_size, max_retries)
+        else:
+            self._session = self._requests_session(pool_size, max_retries, base_backoff)
+        self._session.headers["Content-Type"] = "application/json"
+        if token:
+            self._session.headers["x-auth-token"] = token
+    
+    @staticmethod
+    def _requests_session(pool_size: int, max_retries: int, base_backoff: float) -> requests.Session:
+        """Build the default HTTP/1.1 session with a sized, retrying connection pool."""
+        session = requests.Session()
+        # Connection-level retries happen in urllib3, reusing the pool; status
+        # retries stay in _send where idempotency and Retry-After are handled
+        retry = Retry(
+            total=max_retries,
+            connect=max_retries,
+            read=max_retries,
+            status=0,
+            redirect=None,
+            backoff_factor=base_backoff,
+            allowed_methods=_IDEMPOTENT_METHODS,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=retry,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
     
     def _get_token(self) -> Optional[str]:
-        """Get authentication token."""
-        if self._token:
-            return self._token
-        return get_token(self.api_url)
+        """Get authentication token (loaded from the token store once, then kept)."""
+        if not self._token:
+            self._token = get_token(self.api_url)
+        return self._token
     
     def _set_token(self, token: str) -> None:
         """Set and save authentication token."""
         self._token = token
+        self._session.headers["x-auth-token"] = token
         save_token(self.api_url, token)
     
-    def _get_headers(self) -> Dict[str, str]:
-        """Get request headers with authentication."""
-        headers = {"Content-Type": "application/json"}
+    def _ensure_auth_header(self) -> None:
+        """Put the auth token on the session headers if it isn't there yet."""
+        if "x-auth-token" in self._session.headers:
+            return
         token = self._get_token()
         if token:
-            headers["x-auth-token"] = token
-        return headers
+            self._session.headers["x-auth-token"] = token
     
-    def _handle_response(self, response: requests.Response) -> Any:
+    @staticmethod
+    def _handle_response(response: requests.Response) -> Any:
         """Handle API response and raise appropriate exceptions."""
-        if response.status_code == 200 or response.status_code == 201:
-            # Try to parse JSON, return text if not JSON
+        status = response.status_code
+        # Decide by Content-Type instead of trying to parse every body as JSON;
+        # error pages from proxies are typically text/html or text/plain
+        data = _NOT_JSON
+        if "json" in response.headers.get("content-type", ""):
             try:
-                return response.json()
+                data = _json.loads(response.content)
             except ValueError:
-                return response.text
+                pass
         
-        # Handle errors
-        error_detail = "Unknown error"
-        try:
-            error_data = response.json()
-            if isinstance(error_data, dict):
-                error_detail = error_data.get("detail", str(error_data))
-            else:
-                error_detail = str(error_data)
-        except ValueError:
-            error_detail = response.text or f"HTTP {response.status_code}"
+        if status < 300:
+            return response.text if data is _NOT_JSON else data
         
-        if response.status_code == 401:
-            raise AuthenticationError(error_detail)
-        elif response.status_code == 404:
-            raise NotFoundError(error_detail)
-        elif response.status_code == 400:
-            raise ValidationError(error_detail)
-        elif response.status_code >= 500:
-            raise ServerError(error_detail, status_code=response.status_code)
+        # Handle errors
+        if data is _NOT_JSON:
+            error_detail = response.text or f"HTTP {status}"
+        elif isinstance(data, dict):
+            error_detail = data.get("detail", str(data))
         else:
-            raise AnyMomentException(
-                error_detail,
-                status_code=response.status_code,
+            error_detail = str(data)
+        
+        exc = _STATUS_EXC.get(status)
+        if exc is not None:
+            raise exc(error_detail)
+        if status >= 500:
+            raise ServerError(error_detail, status_code=status)
+        raise AnyMomentException(error_detail, status_code=status)
+    
+    def _backoff_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Full-jitter exponential backoff, floored by a numeric Retry-After (capped at max_backoff)."""
+        delay = random.uniform(0, min(self.max_backoff, self.base_backoff * 2 ** attempt))
+        if isinstance(retry_after, str):
+            try:
+                delay = max(delay, min(float(retry_after), self.max_backoff))
+            except ValueError:
+                pass  # HTTP-date form; fall back to jittered backoff
+        return delay
+    
+    def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict[str, Any]],
+        body: Optional[bytes],
+    ) -> requests.Response:
+        """Send a request, retrying transient error responses with backoff.
+        
+        Connection/read failures are retried below this, by the adapter's
+        urllib3 Retry. Here 502/503/504 are retried for idempotent methods
+        only; POST/PATCH are retried only on 429/503, where the server did not
+        process the request.
+        """
+        idempotent = method in _IDEMPOTENT_METHODS
+        max_retries = self.max_retries
+        send = self._session.request
+        for attempt in range(max(max_retries, 0) + 1):
+            last_attempt = attempt >= max_retries
+            response = send(
+                method=method,
+                url=url,
+                params=params,
+                data=body,
+                timeout=30,
             )
+            
+            status = response.status_code
+            retryable = status in _RETRY_STATUSES if idempotent else status in _RETRY_STATUSES_UNSAFE
+            if not retryable or last_attempt:
+                return response
+            time.sleep(self._backoff_delay(attempt, response.headers.get("Retry-After")))
     
     def _request(
         self,
@@ -96,34 +391,30 @@ class Client:
         retry_on_auth_error: bool = True,
     ) -> Any:
         """Make an HTTP request to the API."""
-        url = f"{self.api_url}{path}"
-        headers = self._get_headers()
+        # Build the URL and encode the body once; both are reused by retries
+        # and the post-refresh resend. The session already sends
+        # Content-Type: application/json.
+        url = self.api_url + path
+        body = None if json_data is None else _json.dumps(json_data)
+        self._ensure_auth_header()
         
-        try:
-            response = self._session.request(
-                method=method,
-                url=url,
-                headers=headers,
-                params=params,
-                json=json_data,
-                timeout=30,
+        if not self._breaker.allow():
+            raise ServerError(
+                f"API at {self.api_url} is failing; not retrying for up to "
+                f"{self._breaker.recovery_timeout:g}s",
+                status_code=503,
             )
+        
+        try:
+            response = self._send_recorded(method, url, params, body)
             
             # Handle 401 with token refresh
             if response.status_code == 401 and retry_on_auth_error:
                 # Try to refresh token
                 try:
                     self.refresh_token()
-                    # Retry once with new token
-                    headers = self._get_headers()
-                    response = self._session.request(
-                        method=method,
-                        url=url,
-                        headers=headers,
-                        params=params,
-                        json=json_data,
-                        timeout=30,
-                    )
+                    # Retry once with new token (refresh updates the session header)
+                    response = self._send_recorded(method, url, params, body)
                 except Exception:
                     # Refresh failed, raise auth error
                     pass
@@ -134,6 +425,36 @@ class Client:
         except requests.exceptions.RequestException as e:
             raise AnyMomentException(f"Request failed: {e}")
     
+    def _send_recorded(
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict[str, Any]],
+        body: Optional[bytes],
+    ) -> requests.Response:
+        """Send once via _send and record the outcome with the circuit breaker."""
+        try:
+            response = self._send(method, url, params, body)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            self._breaker.record_failure()
+            raise
+        except BaseException:
+            # Not a server failure, but a half-open probe must not stay claimed
+            self._breaker.release_probe()
+            raise
+        if response.status_code >= 500:
+            self._breaker.record_failure()
+        else:
+            self._breaker.record_success()
+        return response
+    
+    # Per-verb shorthands: _get(path, params=...), _post(path, json_data=...), ...
+    _get = partialmethod(_request, "GET")
+    _post = partialmethod(_request, "POST")
+    _put = partialmethod(_request, "PUT")
+    _patch = partialmethod(_request, "PATCH")
+    _delete = partialmethod(_request, "DELETE")
+    
     def login(self, email: str, password: str) -> str:
         """
         Authenticate and get a token.
@@ -147,8 +468,9 @@ class Client:
         """
         response = self._session.post(
             f"{self.api_url}/auth/token",
-            json={"email": email, "password": password},
-            headers={"Content-Type": "application/json"},
+            data=_json.dumps({"email": email, "password": password}),
+            # Don't send a stale token along with credentials
+            headers={"x-auth-token": None},
             timeout=30,
         )
         
@@ -187,19 +509,7 @@ class Client:
     
     def get_user_info(self) -> Dict[str, Any]:
         """Get current user information."""
-        return self._request("GET", "/auth/me")
-
-    @staticmethod
-    def _datetime_to_iso(value: Union[str, datetime]) -> str:
-        """Serialize start/end for agenda/search: datetime (naive=UTC) or str to ISO."""
-        if isinstance(value, str):
-            return value
-        if isinstance(value, datetime):
-            dt = value
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            return dt.isoformat()
-        raise TypeError("start/end must be str (ISO 8601) or datetime")
+        return self._get("/auth/me")
 
     # Agenda methods
 
@@ -224,15 +534,44 @@ class Client:
         Returns:
             List of dicts with keys 'event' and 'instances'.
         """
-        params = {
-            "start": self._datetime_to_iso(start),
-            "end": self._datetime_to_iso(end),
-            "use_cache": use_cache,
-            "include_webhooks": include_webhooks,
-        }
-        if calendar_ids is not None:
-            params["calendar_ids"] = calendar_ids
-        return self._request("GET", "/agenda", params=params)
+        params = _agenda_params(start, end, calendar_ids, use_cache, include_webhooks)
+        return self._get("/agenda", params=params)
+
+    def iter_agenda(
+        self,
+        start: Union[str, datetime],
+        end: Union[str, datetime],
+        calendar_ids: Optional[List[str]] = None,
+        chunk_days: int = 7,
+        use_cache: bool = True,
+        include_webhooks: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the agenda for a long window, fetching it ``chunk_days`` at a time.
+        
+        Only one chunk's response is held in memory at once, however large the
+        whole window is. An event with instances in several chunks is yielded
+        once per chunk, each time with that chunk's instances.
+        
+        Args:
+            start: Start of window (ISO 8601 string or datetime; naive = UTC).
+            end: End of window (ISO 8601 string or datetime; naive = UTC).
+            calendar_ids: Optional list of calendar UUIDs to restrict to.
+            chunk_days: Days per request (default 7).
+            use_cache: Use instance cache when available (default True).
+            include_webhooks: Include webhooks in each event payload (default False).
+        
+        Yields:
+            Dicts with keys 'event' and 'instances', as returned by get_agenda.
+        """
+        if chunk_days <= 0:
+            raise ValueError("chunk_days must be positive")
+        step = timedelta(days=chunk_days)
+        chunk_start, end = _to_datetime(start), _to_datetime(end)
+        while chunk_start < end:
+            chunk_end = min(chunk_start + step, end)
+            yield from self.get_agenda(chunk_start, chunk_end, calendar_ids, use_cache, include_webhooks)
+            chunk_start = chunk_end
 
     def search_events(
         self,
@@ -261,16 +600,8 @@ class Client:
         Returns:
             List of dicts with keys 'event', optional 'score', optional 'instances'.
         """
-        params = {"q": q.strip(), "limit": limit, "offset": offset, "include_instances": include_instances}
-        if start is not None:
-            params["start"] = self._datetime_to_iso(start)
-        if end is not None:
-            params["end"] = self._datetime_to_iso(end)
-        if calendar_ids is not None:
-            params["calendar_ids"] = calendar_ids
-        if is_active is not None:
-            params["is_active"] = is_active
-        return self._request("GET", "/agenda/search", params=params)
+        params = _search_params(q, start, end, calendar_ids, is_active, limit, offset, include_instances)
+        return self._get("/agenda/search", params=params)
 
     # Calendar methods
     
@@ -281,18 +612,14 @@ class Client:
         offset: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """List all calendars for the authenticated user."""
-        params = {}
-        if is_active is not None:
-            params["is_active"] = is_active
-        if limit is not None:
-            params["limit"] = limit
-        if offset is not None:
-            params["offset"] = offset
-        return self._request("GET", "/calendars", params=params)
+        return self._get(
+            "/calendars",
+            params=_only_set(is_active=_BOOL_PARAM.get(is_active), limit=limit, offset=offset),
+        )
     
     def get_calendar(self, calendar_id: str) -> Dict[str, Any]:
         """Get a specific calendar by ID."""
-        return self._request("GET", f"/calendars/{calendar_id}")
+        return self._get(f"/calendars/{calendar_id}")
     
     def create_calendar(
         self,
@@ -302,15 +629,8 @@ class Client:
         color: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Create a new calendar."""
-        data = {
-            "name": name,
-            "timezone": timezone,
-        }
-        if description is not None:
-            data["description"] = description
-        if color is not None:
-            data["color"] = color
-        return self._request("POST", "/calendars", json_data=data)
+        data = _only_set(name=name, timezone=timezone, description=description, color=color)
+        return self._post("/calendars", json_data=data)
     
     def update_calendar(
         self,
@@ -322,22 +642,18 @@ class Client:
         is_active: bool | None = None,
     ) -> Dict[str, Any]:
         """Update a calendar."""
-        data = {}
-        if name is not None:
-            data["name"] = name
-        if description is not None:
-            data["description"] = description
-        if timezone is not None:
-            data["timezone"] = timezone
-        if color is not None:
-            data["color"] = color
-        if is_active is not None:
-            data["is_active"] = is_active
-        return self._request("PUT", f"/calendars/{calendar_id}", json_data=data)
+        data = _only_set(
+            name=name,
+            description=description,
+            timezone=timezone,
+            color=color,
+            is_active=is_active,
+        )
+        return self._put(f"/calendars/{calendar_id}", json_data=data)
     
     def delete_calendar(self, calendar_id: str) -> None:
         """Delete a calendar."""
-        self._request("DELETE", f"/calendars/{calendar_id}")
+        self._delete(f"/calendars/{calendar_id}")
     
     def share_calendar(
         self,
@@ -350,7 +666,7 @@ class Client:
             "user_id": user_id,
             "role": role,
         }
-        return self._request("POST", f"/calendars/{calendar_id}/share", json_data=data)
+        return self._post(f"/calendars/{calendar_id}/share", json_data=data)
 
     def update_calendar_share_role(
         self,
@@ -360,15 +676,15 @@ class Client:
     ) -> Dict[str, Any]:
         """Update a shared user's role for a calendar (owner, editor, viewer)."""
         data = {"role": role}
-        return self._request("PUT", f"/calendars/{calendar_id}/share/{user_id}", json_data=data)
+        return self._put(f"/calendars/{calendar_id}/share/{user_id}", json_data=data)
 
     def unshare_calendar(self, calendar_id: str, user_id: str) -> Dict[str, Any]:
         """Remove an AnyMoment share for a calendar (user loses access unless linked via Google)."""
-        return self._request("DELETE", f"/calendars/{calendar_id}/share/{user_id}")
+        return self._delete(f"/calendars/{calendar_id}/share/{user_id}")
 
     def get_calendar_webhook_url(self, calendar_id: str) -> dict[str, Any]:
         """Get webhook URL for a calendar."""
-        return self._request("GET", f"/calendars/{calendar_id}/webhook-url")
+        return self._get(f"/calendars/{calendar_id}/webhook-url")
     
     # Event methods
     
@@ -381,22 +697,18 @@ class Client:
         minimal: bool = False,
     ) -> List[Dict[str, Any]]:
         """List all events for the authenticated user."""
-        params = {}
-        if calendar_id is not None:
-            params["calendar_id"] = calendar_id
-        if is_active is not None:
-            params["is_active"] = is_active
-        if limit is not None:
-            params["limit"] = limit
-        if offset is not None:
-            params["offset"] = offset
-        if minimal:
-            params["minimal"] = True
-        return self._request("GET", "/events", params=params)
+        params = _only_set(
+            calendar_id=calendar_id,
+            is_active=_BOOL_PARAM.get(is_active),
+            limit=limit,
+            offset=offset,
+            minimal="true" if minimal else None,
+        )
+        return self._get("/events", params=params)
     
     def get_event(self, event_id: str) -> Dict[str, Any]:
         """Get a specific event by ID."""
-        return self._request("GET", f"/events/{event_id}")
+        return self._get(f"/events/{event_id}")
     
     def create_event_from_text(
         self,
@@ -408,18 +720,15 @@ class Client:
         model: str = "high",
     ) -> Dict[str, Any]:
         """Create an event from natural language text."""
-        data = {
-            "recurrence_text": recurrence_text,
-            "timezone": timezone,
-            "model": model,
-        }
-        if name is not None:
-            data["name"] = name
-        if description is not None:
-            data["description"] = description
-        if calendar_id is not None:
-            data["calendar_id"] = calendar_id
-        return self._request("POST", "/events/from-recurrence-text", json_data=data)
+        data = _only_set(
+            recurrence_text=recurrence_text,
+            timezone=timezone,
+            model=model,
+            name=name,
+            description=description,
+            calendar_id=calendar_id,
+        )
+        return self._post("/events/from-recurrence-text", json_data=data)
     
     def update_event(
         self,
@@ -428,20 +737,16 @@ class Client:
         description: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Update an event."""
-        data = {}
-        if name is not None:
-            data["name"] = name
-        if description is not None:
-            data["description"] = description
-        return self._request("PUT", f"/events/{event_id}", json_data=data)
+        data = _only_set(name=name, description=description)
+        return self._put(f"/events/{event_id}", json_data=data)
     
     def delete_event(self, event_id: str) -> None:
         """Delete an event."""
-        self._request("DELETE", f"/events/{event_id}")
+        self._delete(f"/events/{event_id}")
     
     def toggle_event(self, event_id: str) -> dict[str, Any]:
         """Toggle event active status."""
-        return self._request("PATCH", f"/events/{event_id}/toggle")
+        return self._patch(f"/events/{event_id}/toggle")
     
     def get_event_instances(
         self,
@@ -451,18 +756,13 @@ class Client:
         optimized: bool = False,
     ) -> List[Dict[str, Any]]:
         """Get event instances for a date range."""
-        params = {}
-        if from_date is not None:
-            params["from"] = from_date
-        if to_date is not None:
-            params["to"] = to_date
-        if optimized:
-            params["optimized"] = True
-        return self._request("GET", f"/events/{event_id}/instances", params=params)
+        # "from" is a keyword, hence the ** form
+        params = _only_set(**{"from": from_date}, to=to_date, optimized="true" if optimized else None)
+        return self._get(f"/events/{event_id}/instances", params=params)
     
     def get_next_event_instance(self, event_id: str) -> Dict[str, Any]:
         """Get the next instance of an event."""
-        return self._request("GET", f"/events/{event_id}/next-instance")
+        return self._get(f"/events/{event_id}/next-instance")
     
     # Calendar-Event Link methods
 
@@ -474,12 +774,8 @@ class Client:
         color_override: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """Add multiple events to a calendar in one request."""
-        data: Dict[str, Any] = {"event_ids": event_ids}
-        if display_order is not None:
-            data["display_order"] = display_order
-        if color_override is not None:
-            data["color_override"] = color_override
-        return self._request("POST", f"/calendars/{calendar_id}/events", json_data=data)
+        data = _only_set(event_ids=event_ids, display_order=display_order, color_override=color_override)
+        return self._post(f"/calendars/{calendar_id}/events", json_data=data)
 
     def batch_remove_events_from_calendar(
         self,
@@ -487,8 +783,7 @@ class Client:
         event_ids: List[str],
     ) -> Dict[str, Any]:
         """Remove multiple events from a calendar (unlink only; events are not deleted)."""
-        return self._request(
-            "POST",
+        return self._post(
             f"/calendars/{calendar_id}/events/batch-unlink",
             json_data={"event_ids": event_ids},
         )
@@ -501,13 +796,8 @@ class Client:
         color_override: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Link an event to a calendar."""
-        data = {}
-        if display_order is not None:
-            data["display_order"] = display_order
-        if color_override is not None:
-            data["color_override"] = color_override
-        return self._request(
-            "POST",
+        data = _only_set(display_order=display_order, color_override=color_override)
+        return self._post(
             f"/calendars/{calendar_id}/events/{event_id}",
             json_data=data,
         )
@@ -518,4 +808,4 @@ class Client:
         event_id: str,
     ) -> None:
         """Unlink an event from a calendar."""
-        self._request("DELETE", f"/calendars/{calendar_id}/events/{event_id}")
+        self._delete(f"/calendars/{calendar_id}/events/{event_id}")
@@ -2,50 +2,88 @@
 
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from anymoment import _json
 from anymoment.exceptions import ConfigError
 
 DEFAULT_API_URL = "https://api.anymoment.sineways.tech"
 CONFIG_DIR = Path.home() / ".anymoment"
-CONFIG_FILE = CONFIG_DIR / "config.json"
+
+# Parsed config keyed by file path and mtime, so repeated lookups skip disk I/O
+_CACHE: Dict[str, Any] = {"path": None, "mtime": None, "data": None}
+_ENSURED_DIR: Optional[Path] = None
+
+
+@lru_cache(maxsize=1)
+def _config_file() -> Path:
+    """Path of the config file in CONFIG_DIR (call ``_config_file.cache_clear()`` after changing CONFIG_DIR)."""
+    return CONFIG_DIR / "config.json"
+
+
+def __getattr__(name: str) -> Any:
+    # CONFIG_FILE used to be a module constant; keep it readable for existing callers
+    if name == "CONFIG_FILE":
+        return _config_file()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def ensure_config_dir() -> None:
-    """Ensure the config directory exists."""
+    """Ensure the config directory exists (checked once per directory per process)."""
+    global _ENSURED_DIR
+    if _ENSURED_DIR == CONFIG_DIR:
+        return
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    _ENSURED_DIR = CONFIG_DIR
+
+
+def _invalidate_cache() -> None:
+    """Drop the cached config so the next load re-reads the file."""
+    _CACHE.update(path=None, mtime=None, data=None)
 
 
 def load_config() -> dict[str, Any]:
-    """Load configuration from file."""
-    ensure_config_dir()
+    """Load configuration from file.
     
-    if not CONFIG_FILE.exists():
+    The parsed file is cached and only re-read when its mtime changes.
+    A copy is returned so callers can mutate it freely. Reading never
+    creates the config directory; only saving does.
+    """
+    try:
+        mtime = _config_file().stat().st_mtime
+    except FileNotFoundError:
         return {
             "default_api_url": DEFAULT_API_URL,
             "default_timezone": "UTC",
             "default_calendar_id": None,
         }
     
+    if _CACHE["path"] == _config_file() and _CACHE["mtime"] == mtime:
+        return dict(_CACHE["data"])
+    
     try:
-        with open(CONFIG_FILE, "r") as f:
-            config = json.load(f)
+        with open(_config_file(), "rb") as f:
+            config = _json.loads(f.read())
             # Ensure default_api_url is set
             if "default_api_url" not in config:
                 config["default_api_url"] = DEFAULT_API_URL
-            return config
     except (json.JSONDecodeError, IOError) as e:
         raise ConfigError(f"Failed to load configuration: {e}")
+    
+    _CACHE.update(path=_config_file(), mtime=mtime, data=config)
+    return dict(config)
 
 
 def save_config(config: Dict[str, Any]) -> None:
     """Save configuration to file."""
     ensure_config_dir()
+    _invalidate_cache()
     
     try:
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(config, f, indent=2)
+        with open(_config_file(), "wb") as f:
+            f.write(_json.dumps_indented(config))
     except IOError as e:
         raise ConfigError(f"Failed to save configuration: {e}")
 
@@ -63,34 +101,53 @@ def set_config(key: str, value: Any) -> None:
     save_config(config)
 
 
-def get_api_url() -> str:
-    """Get the default API URL from config or environment."""
+def _lookup(config: Optional[Dict[str, Any]], key: str, default: Any) -> Any:
+    """Read a key from an already-loaded config dict, or load it if not given."""
+    if config is None:
+        return get_config(key, default)
+    return config.get(key, default)
+
+
+def get_api_url(config: Optional[Dict[str, Any]] = None) -> str:
+    """Get the default API URL from config or environment.
+    
+    Args:
+        config: Optional already-loaded config dict to avoid reloading the file.
+    """
     # Check environment variable first
     env_url = os.getenv("ANYMOMENT_BASE_URL")
     if env_url:
         return env_url
     
     # Then check config file
-    return get_config("default_api_url", DEFAULT_API_URL)
+    return _lookup(config, "default_api_url", DEFAULT_API_URL)
 
 
-def get_default_timezone() -> str:
-    """Get the default timezone from config or environment."""
+def get_default_timezone(config: Optional[Dict[str, Any]] = None) -> str:
+    """Get the default timezone from config or environment.
+    
+    Args:
+        config: Optional already-loaded config dict to avoid reloading the file.
+    """
     # Check environment variable first
     env_tz = os.getenv("ANYMOMENT_DEFAULT_TIMEZONE")
     if env_tz:
         return env_tz
     
     # Then check config file
-    return get_config("default_timezone", "UTC")
+    return _lookup(config, "default_timezone", "UTC")
 
 
-def get_default_calendar_id() -> Optional[str]:
-    """Get the default calendar ID from config or environment."""
+def get_default_calendar_id(config: Optional[Dict[str, Any]] = None) -> Optional[str]:
+    """Get the default calendar ID from config or environment.
+    
+    Args:
+        config: Optional already-loaded config dict to avoid reloading the file.
+    """
     # Check environment variable first
     env_cal = os.getenv("ANYMOMENT_DEFAULT_CALENDAR")
     if env_cal:
         return env_cal
     
     # Then check config file
-    return get_config("default_calendar_id", None)
+    return _lookup(config, "default_calendar_id", None)
@@ -1,35 +1,65 @@
 """Token management with encrypted storage for AnyMoment SDK."""
 
+import base64
+import hashlib
 import json
 import os
 import platform
+import tempfile
+import time
+from contextlib import contextmanager
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
-
-import jwt
-from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from cryptography.hazmat.backends import default_backend
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional
 
+from anymoment import _json
 from anymoment.exceptions import TokenError
 
+if TYPE_CHECKING:
+    from cryptography.fernet import Fernet
+
+# cryptography is imported where used: it is slow to import and not needed
+# at all when a Client is given an explicit token
+
 TOKEN_DIR = Path.home() / ".anymoment"
-TOKEN_FILE = TOKEN_DIR / "tokens.json"
+KEYRING_SERVICE = "anymoment"
 
+# Decrypted tokens keyed by file path and mtime, so repeated lookups skip decryption
+_CACHE: Dict[str, Any] = {"path": None, "mtime": None, "data": None}
 
-def _get_fernet() -> Fernet:
-    """Get Fernet instance with machine-specific key."""
-    import base64
-    import hashlib
-    
-    # Derive a stable key from machine-specific information
+
+def _key_material() -> bytes:
+    """Machine-specific (not secret) input for the token encryption key."""
     machine_id = platform.node()
     user_home = str(Path.home())
-    key_material = f"{machine_id}:{user_home}:anymoment-token-key".encode()
+    return f"{machine_id}:{user_home}:anymoment-token-key".encode()
+
+
+@lru_cache(maxsize=1)
+def _get_fernet() -> "Fernet":
+    """Get Fernet instance with machine-specific key (derived once per process).
     
-    # Use PBKDF2 to derive a 32-byte key
+    The key material is public machine info, so key stretching adds nothing;
+    a single BLAKE2b hash derives the 32-byte key.
+    """
+    from cryptography.fernet import Fernet
+    
+    key = hashlib.blake2b(_key_material(), digest_size=32, person=b"anymoment-fern").digest()
+    
+    # Fernet requires a URL-safe base64-encoded 32-byte key
+    return Fernet(base64.urlsafe_b64encode(key))
+
+
+@lru_cache(maxsize=1)
+def _get_legacy_fernet() -> "Fernet":
+    """Get the PBKDF2-derived Fernet used by older versions, to read their token files."""
+    from cryptography.fernet import Fernet
+    from cryptography.hazmat.backends import default_backend
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+    
+    key_material = _key_material()
     salt = hashlib.sha256(key_material).digest()[:16]  # 16-byte salt
     kdf = PBKDF2HMAC(
         algorithm=hashes.SHA256(),
@@ -38,12 +68,63 @@ def _get_fernet() -> Fernet:
         iterations=100000,
         backend=default_backend(),
     )
-    key = kdf.derive(key_material)
+    return Fernet(base64.urlsafe_b64encode(kdf.derive(key_material)))
+
+
+def _get_keyring():
+    """Get the keyring module when ANYMOMENT_TOKEN_STORE=keyring and an OS backend is available.
     
-    # Fernet requires a URL-safe base64-encoded 32-byte key
-    key_b64 = base64.urlsafe_b64encode(key)
+    Returns None otherwise, in which case tokens are Fernet-encrypted in the token file.
+    """
+    if os.getenv("ANYMOMENT_TOKEN_STORE", "").lower() != "keyring":
+        return None
+    try:
+        import keyring
+        from keyring.backends import fail
+    except ImportError:
+        return None
+    if isinstance(keyring.get_keyring(), fail.Keyring):
+        return None
+    return keyring
+
+
+def _keyring_errors(keyring: Any) -> tuple:
+    """Exceptions from a keyring backend call that mean the keyring can't be used right now.
     
-    return Fernet(key_b64)
+    KeyringError covers keyring's own backends; platform bindings (D-Bus,
+    locked keychains) surface as RuntimeError or OSError.
+    """
+    return (keyring.errors.KeyringError, RuntimeError, OSError)
+
+
+@lru_cache(maxsize=1)
+def _token_file() -> Path:
+    """Path of the token file in TOKEN_DIR (call ``_token_file.cache_clear()`` after changing TOKEN_DIR)."""
+    return TOKEN_DIR / "tokens.json"
+
+
+def __getattr__(name: str) -> Any:
+    # TOKEN_FILE used to be a module constant; keep it readable for existing callers
+    if name == "TOKEN_FILE":
+        return _token_file()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _read_index() -> Dict[str, Any]:
+    """Read the raw (encrypted / keyring-referencing) token file."""
+    try:
+        with open(_token_file(), "rb") as f:
+            return _json.loads(f.read())
+    except FileNotFoundError:
+        return {}
+
+
+def _index_mtime() -> Optional[float]:
+    """Modification time of the token file, or None if there is none yet."""
+    try:
+        return _token_file().stat().st_mtime
+    except FileNotFoundError:
+        return None
 
 
 def _ensure_token_dir() -> None:
@@ -51,58 +132,223 @@ def _ensure_token_dir() -> None:
     TOKEN_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def _invalidate_cache() -> None:
+    """Drop the cached tokens so the next load re-reads the file."""
+    _CACHE.update(path=None, mtime=None, data=None)
+
+
 def _load_tokens() -> Dict[str, Any]:
-    """Load encrypted tokens from file."""
+    """Load encrypted tokens from file.
+    
+    The decrypted tokens are cached and only re-read when the file's mtime
+    changes. A copy is returned so callers can mutate it freely.
+    """
     _ensure_token_dir()
     
-    if not TOKEN_FILE.exists():
+    mtime = _index_mtime()
+    if mtime is None:
         return {}
     
+    if _CACHE["path"] == _token_file() and _CACHE["mtime"] == mtime:
+        return dict(_CACHE["data"])
+    
     try:
-        with open(TOKEN_FILE, "r") as f:
-            encrypted_data = json.load(f)
+        encrypted_data = _read_index()
         
         # Decrypt tokens
         fernet = _get_fernet()
+        keyring = None
         decrypted_data = {}
+        migrated = []
         
         for host_url, token_data in encrypted_data.items():
-            try:
-                decrypted_token = fernet.decrypt(token_data["token"].encode()).decode()
-                decrypted_data[host_url] = {
-                    "token": decrypted_token,
-                    "expires_at": token_data.get("expires_at"),
-                }
-            except Exception as e:
-                # Skip invalid tokens
+            if token_data.get("keyring"):
+                # Secret lives in the OS keyring; the file only indexes it
+                keyring = keyring or _get_keyring()
+                if keyring is None:
+                    # Keyring store not enabled in this process: leave the entry
+                    # on disk; get_token reports it instead of a silent logout
+                    continue
+                try:
+                    decrypted_token = keyring.get_password(KEYRING_SERVICE, host_url)
+                except _keyring_errors(keyring):
+                    decrypted_token = None
+                if decrypted_token:
+                    decrypted_data[host_url] = {
+                        "token": decrypted_token,
+                        "expires_at": token_data.get("expires_at"),
+                    }
                 continue
-        
-        return decrypted_data
+            encrypted_token = token_data["token"].encode()
+            try:
+                decrypted_token = fernet.decrypt(encrypted_token).decode()
+            except Exception:
+                # Written by an older version with the PBKDF2 key?
+                try:
+                    decrypted_token = _get_legacy_fernet().decrypt(encrypted_token).decode()
+                    migrated.append(host_url)
+                except Exception:
+                    # Skip invalid tokens
+                    continue
+            decrypted_data[host_url] = {
+                "token": decrypted_token,
+                "expires_at": token_data.get("expires_at"),
+            }
     except (json.JSONDecodeError, IOError) as e:
         raise TokenError(f"Failed to load tokens: {e}")
+    
+    if migrated:
+        # Re-encrypt just those entries with the current key so the legacy key is
+        # derived only once; every other entry is copied through as stored
+        for host_url in migrated:
+            encrypted_data[host_url] = _encode_entry(host_url, decrypted_data[host_url], None)
+        try:
+            _write_index(encrypted_data)
+        except IOError as e:
+            raise TokenError(f"Failed to save tokens: {e}")
+        mtime = _index_mtime()
+    
+    _CACHE.update(path=_token_file(), mtime=mtime, data=decrypted_data)
+    return dict(decrypted_data)
+
+
+def _encode_entry(host_url: str, token_data: Dict[str, Any], keyring: Any) -> Dict[str, Any]:
+    """Build the on-disk entry for one token: a keyring reference or the Fernet ciphertext."""
+    token = token_data["token"]
+    entry = None
+    if keyring is not None:
+        try:
+            keyring.set_password(KEYRING_SERVICE, host_url, token)
+            entry = {"keyring": True}
+        except _keyring_errors(keyring):
+            pass  # fall back to the encrypted file
+    if entry is None:
+        entry = {"token": _get_fernet().encrypt(token.encode()).decode()}
+    entry["expires_at"] = token_data.get("expires_at")
+    return entry
+
+
+def _drop_keyring_entry(host_url: str, entry: Dict[str, Any]) -> None:
+    """Delete the keyring secret behind an index entry, if it has one."""
+    keyring = _get_keyring() if entry.get("keyring") else None
+    if keyring is None:
+        return
+    try:
+        keyring.delete_password(KEYRING_SERVICE, host_url)
+    except _keyring_errors(keyring):
+        pass  # best effort: the index entry is removed either way
+
+
+def _write_index(index: Dict[str, Any]) -> None:
+    """Atomically replace the token file (temp file in the same dir + os.replace)."""
+    fd, tmp_path = tempfile.mkstemp(dir=TOKEN_DIR, prefix=".tokens-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_json.dumps_indented(index))
+        os.replace(tmp_path, _token_file())
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _cached_tokens() -> Optional[Dict[str, Any]]:
+    """The cached decrypted tokens if they still match the token file on disk, else None."""
+    if _CACHE["path"] != _token_file() or _CACHE["data"] is None:
+        return None
+    if _index_mtime() != _CACHE["mtime"]:
+        return None
+    return _CACHE["data"]
+
+
+def _update_entry(host_url: str, token_data: Optional[Dict[str, Any]]) -> None:
+    """Set (or with None, remove) one host's token, touching only that entry.
+    
+    Other entries are copied through still encrypted, and a current cache
+    is patched in place instead of being dropped.
+    """
+    _ensure_token_dir()
+    
+    try:
+        cached = _cached_tokens()
+        index = _read_index()
+        if token_data is None:
+            entry = index.pop(host_url, None)
+            if entry is None:
+                return
+            _drop_keyring_entry(host_url, entry)
+        else:
+            index[host_url] = _encode_entry(host_url, token_data, _get_keyring())
+        _write_index(index)
+    except (json.JSONDecodeError, IOError) as e:
+        _invalidate_cache()
+        raise TokenError(f"Failed to save tokens: {e}")
+    
+    if cached is None:
+        _invalidate_cache()
+        return
+    if token_data is None:
+        cached.pop(host_url, None)
+    else:
+        cached[host_url] = dict(token_data)
+    _CACHE["mtime"] = _index_mtime()
 
 
 def _save_tokens(tokens: dict[str, Any]) -> None:
-    """Save encrypted tokens to file."""
+    """Save tokens: to the OS keyring if enabled, else encrypted to file.
+    
+    The token file always holds the index of hosts and expiry times.
+    """
     _ensure_token_dir()
+    _invalidate_cache()
     
     try:
-        fernet = _get_fernet()
-        encrypted_data = {}
+        keyring = _get_keyring()
+        index = {
+            host_url: _encode_entry(host_url, token_data, keyring)
+            for host_url, token_data in tokens.items()
+        }
         
-        for host_url, token_data in tokens.items():
-            encrypted_token = fernet.encrypt(token_data["token"].encode()).decode()
-            encrypted_data[host_url] = {
-                "token": encrypted_token,
-                "expires_at": token_data.get("expires_at"),
-            }
+        # Drop keyring secrets for hosts that were removed. A corrupt file has
+        # none we can find, and overwriting it is how `tokens clear` repairs it.
+        try:
+            previous = _read_index()
+        except ValueError:
+            previous = {}
+        for host_url, entry in previous.items():
+            if host_url not in index:
+                _drop_keyring_entry(host_url, entry)
         
-        with open(TOKEN_FILE, "w") as f:
-            json.dump(encrypted_data, f, indent=2)
-    except IOError as e:
+        _write_index(index)
+    except (json.JSONDecodeError, IOError) as e:
         raise TokenError(f"Failed to save tokens: {e}")
 
 
+_INVALID = object()
+
+
+@lru_cache(maxsize=256)
+def _jwt_exp(token: str) -> Any:
+    """Read the ``exp`` claim from a JWT payload without verifying it.
+    
+    Returns the expiry (epoch seconds), None if the token has no ``exp``,
+    or ``_INVALID`` if the token can't be decoded. The result depends only
+    on the token string, so it is cached: repeated ``get_token`` calls just
+    compare the cached expiry with the clock.
+    """
+    try:
+        _, payload, _ = token.split(".", 2)
+        payload += "=" * (-len(payload) % 4)
+        exp = _json.loads(base64.urlsafe_b64decode(payload)).get("exp")
+    except Exception:
+        return _INVALID
+    if exp is None or (isinstance(exp, (int, float)) and not isinstance(exp, bool)):
+        return exp
+    return _INVALID
+
+
 def _is_token_expired(token: str) -> bool:
     """Check if a JWT token is expired.
     
@@ -117,68 +363,100 @@ def _is_token_expired(token: str) -> bool:
         # Not a valid JWT format - treat as expired/invalid
         return True
     
-    try:
-        decoded = jwt.decode(token, options={"verify_signature": False})
-        exp = decoded.get("exp")
-        if exp is None:
-            # No expiration means permanent token - never expired
-            return False
-        
-        now = datetime.now(timezone.utc).timestamp()
-        return now >= exp
-    except jwt.DecodeError:
-        # Invalid JWT format - can't determine expiration, assume expired for safety
-        return True
-    except Exception:
-        # Other errors (e.g., invalid token structure) - assume expired for safety
+    exp = _jwt_exp(token)
+    if exp is _INVALID:
+        # Can't determine expiration, assume expired for safety
         return True
+    if exp is None:
+        # No expiration means permanent token - never expired
+        return False
+    return time.time() >= exp
+
+
+def _entry_expired(token_data: Dict[str, Any]) -> bool:
+    """Whether a stored token is expired, using the epoch exp saved alongside it when there is one."""
+    expires_at = token_data.get("expires_at")
+    if isinstance(expires_at, (int, float)):
+        return time.time() >= expires_at
+    # Permanent, unparseable or hand-edited entries: read the token itself
+    return _is_token_expired(token_data["token"])
 
 
 def get_token(host_url: str) -> Optional[str]:
-    """Get stored token for a host URL."""
+    """Get stored token for a host URL.
+    
+    Raises TokenError if the host's token was saved to the OS keyring but the
+    keyring store is not enabled in this process.
+    """
     tokens = _load_tokens()
     token_data = tokens.get(host_url)
     
     if not token_data:
+        if _get_keyring() is None and _read_index().get(host_url, {}).get("keyring"):
+            raise TokenError(
+                f"Token for {host_url} is stored in the OS keyring; set ANYMOMENT_TOKEN_STORE=keyring"
+            )
         return None
     
-    token = token_data["token"]
-    
     # Check if expired
-    if _is_token_expired(token):
+    if _entry_expired(token_data):
         return None
     
-    return token
+    return token_data["token"]
+
+
+def _token_entry(token: str) -> Dict[str, Any]:
+    """The stored record for a token: the token and its expiry, if it has one."""
+    # Decode token to get expiration
+    exp = _jwt_exp(token) if isinstance(token, str) else None
+    expires_at = exp if exp is not _INVALID and exp else None
+    return {"token": token, "expires_at": expires_at}
 
 
 def save_token(host_url: str, token: str) -> None:
     """Save token for a host URL."""
-    tokens = _load_tokens()
-    
-    # Decode token to get expiration
-    expires_at = None
-    try:
-        decoded = jwt.decode(token, options={"verify_signature": False})
-        exp = decoded.get("exp")
-        if exp:
-            expires_at = exp
-    except Exception:
-        pass
-    
-    tokens[host_url] = {
-        "token": token,
-        "expires_at": expires_at,
-    }
-    
-    _save_tokens(tokens)
+    _update_entry(host_url, _token_entry(token))
 
 
 def delete_token(host_url: str) -> None:
     """Delete token for a host URL."""
-    tokens = _load_tokens()
-    if host_url in tokens:
-        del tokens[host_url]
-        _save_tokens(tokens)
+    _update_entry(host_url, None)
+
+
+@contextmanager
+def transaction() -> Iterator[Dict[str, str]]:
+    """Batch several token changes into a single write.
+    
+    Yields the stored tokens as a ``{host_url: token}`` dict. Set or delete
+    keys in it; the result is saved once when the block exits, and nothing
+    is written if the block raises::
+    
+        with transaction() as tokens:
+            tokens[host1] = token1
+            del tokens[host2]
+    """
+    stored = _load_tokens()
+    tokens = {host_url: token_data["token"] for host_url, token_data in stored.items()}
+    yield tokens
+    
+    # Apply only what changed to the raw index, so entries that could not be
+    # loaded here (other key, keyring store off) are copied through untouched
+    _ensure_token_dir()
+    try:
+        index = _read_index()
+        for host_url in stored.keys() - tokens.keys():
+            entry = index.pop(host_url, None)
+            if entry is not None:
+                _drop_keyring_entry(host_url, entry)
+        keyring = _get_keyring()
+        for host_url, token in tokens.items():
+            if stored.get(host_url, {}).get("token") != token:
+                index[host_url] = _encode_entry(host_url, _token_entry(token), keyring)
+        _write_index(index)
+    except (json.JSONDecodeError, IOError) as e:
+        raise TokenError(f"Failed to save tokens: {e}")
+    finally:
+        _invalidate_cache()
 
 
 def clear_all_tokens() -> None:
@@ -195,8 +473,8 @@ def list_tokens() -> Dict[str, Any]:
         token = token_data.get("token")
         if not token:
             continue
-            
-        is_expired = _is_token_expired(token)
+        
+        is_expired = _entry_expired(token_data)
         
         # Check if token is invalid (not a proper JWT)
         is_invalid = False
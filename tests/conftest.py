@@ -1,85 +1,158 @@
 """Pytest fixtures for AnyMoment tests."""
 
 import json
-from pathlib import Path
-from unittest.mock import MagicMock, patch
+import time
+from types import MappingProxyType
 
+import jwt
 import pytest
+from requests.structures import CaseInsensitiveDict
 
-from anymoment.client import Client
+from anymoment import config, token_manager
+
+try:
+    import pytest_socket
+except ImportError:  # optional dev dependency
+    pytest_socket = None
+
+
+def pytest_runtest_setup(item):
+    """Refuse real network connections in every test when pytest-socket is installed.
+    
+    Unix sockets stay allowed: asyncio's event loop needs a local socketpair.
+    A test that really needs the network can opt out with ``@pytest.mark.enable_socket``.
+    """
+    if pytest_socket is not None and not item.get_closest_marker("enable_socket"):
+        pytest_socket.disable_socket(allow_unix_socket=True)
+
+
+@pytest.fixture(scope="session")
+def _session_token_root(tmp_path_factory):
+    """Temporary token directory, created once per test session."""
+    return tmp_path_factory.mktemp("anymoment_tokens")
+
+
+@pytest.fixture(scope="session")
+def _session_config_root(tmp_path_factory):
+    """Temporary config directory, created once per test session."""
+    return tmp_path_factory.mktemp("anymoment_config")
 
 
 @pytest.fixture
-def mock_token_file(tmp_path, monkeypatch):
+def mock_token_file(_session_token_root, monkeypatch):
     """Mock token file location.
     
     This fixture ensures tests use a temporary directory for token storage,
-    preventing tests from reading or writing real user tokens.
+    preventing tests from reading or writing real user tokens. The directory
+    is shared by the session; the file is removed before each test.
     """
-    token_dir = tmp_path / ".anymoment"
-    token_dir.mkdir()
-    token_file = token_dir / "tokens.json"
+    # Point the token dir at the temp root; the file path is derived from it
+    monkeypatch.setattr(token_manager, "TOKEN_DIR", _session_token_root)
+    token_manager._token_file.cache_clear()
+    token_file = token_manager._token_file()
     
-    # Patch the token file path at module level to ensure all imports use it
-    monkeypatch.setattr("anymoment.token_manager.TOKEN_DIR", token_dir)
-    monkeypatch.setattr("anymoment.token_manager.TOKEN_FILE", token_file)
+    # Start from no file and no cached tokens (a reused path can repeat an mtime)
+    token_file.unlink(missing_ok=True)
+    token_manager._invalidate_cache()
     
-    # Ensure the file doesn't exist initially
-    if token_file.exists():
-        token_file.unlink()
+    yield token_file
+    # Forget the temp path before monkeypatch restores the real dir
+    token_manager._token_file.cache_clear()
+
+
+@pytest.fixture
+def memory_token_store(mock_token_file, monkeypatch):
+    """Keep the token index in a dict instead of the token file.
+    
+    Tokens are still encrypted and cached exactly as on disk; only the file
+    read, write and mtime check are replaced, so tests that never look at
+    the file skip the I/O. Builds on ``mock_token_file``, so anything that
+    still reaches the filesystem lands in the temporary directory.
+    """
+    store = {"index": {}, "mtime": None}
+    
+    def write_index(index):
+        store["index"] = dict(index)
+        store["mtime"] = (store["mtime"] or 0) + 1
     
-    return token_file
+    monkeypatch.setattr(token_manager, "_read_index", lambda: dict(store["index"]))
+    monkeypatch.setattr(token_manager, "_write_index", write_index)
+    monkeypatch.setattr(token_manager, "_index_mtime", lambda: store["mtime"])
+    return store
 
 
 @pytest.fixture
-def mock_config_file(tmp_path, monkeypatch):
+def mock_config_file(_session_config_root, monkeypatch):
     """Mock config file location.
     
     This fixture ensures tests use a temporary directory for config storage,
-    preventing tests from reading or writing real user configuration.
+    preventing tests from reading or writing real user configuration. The
+    directory is shared by the session; the file is removed before each test.
     """
-    config_dir = tmp_path / ".anymoment"
-    config_dir.mkdir()
-    config_file = config_dir / "config.json"
+    # Point the config dir at the temp root; the file path is derived from it
+    monkeypatch.setattr(config, "CONFIG_DIR", _session_config_root)
+    config._config_file.cache_clear()
+    config_file = config._config_file()
+    
+    # Start from no file and no cached config (a reused path can repeat an mtime)
+    config_file.unlink(missing_ok=True)
+    config._invalidate_cache()
+    
+    yield config_file
+    # Forget the temp path before monkeypatch restores the real dir
+    config._config_file.cache_clear()
+
+
+class _FakeResp:
+    """Plain stand-in for ``requests.Response``: only what the client reads."""
     
-    # Patch the config file path at module level to ensure all imports use it
-    monkeypatch.setattr("anymoment.config.CONFIG_DIR", config_dir)
-    monkeypatch.setattr("anymoment.config.CONFIG_FILE", config_file)
+    __slots__ = ("status_code", "headers", "_json", "_text")
     
-    # Ensure the file doesn't exist initially
-    if config_file.exists():
-        config_file.unlink()
+    def __init__(self, status_code, json_data, text, content_type):
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict({"Content-Type": content_type})
+        self._json = json_data
+        self._text = text
     
-    return config_file
+    @property
+    def text(self):
+        # JSON bodies are serialized on first read; responses a test never sends stay free
+        if self._text is None:
+            # default=dict accepts the read-only MappingProxyType sample fixtures
+            self._text = json.dumps(self._json, default=dict)
+        return self._text
+    
+    @property
+    def content(self):
+        return self.text.encode()
+    
+    def json(self):
+        if self._json is None:
+            raise ValueError("Not JSON")
+        return self._json
 
 
 @pytest.fixture
 def mock_api_response():
-    """Create a mock API response.
+    """Create a canned API response.
     
     This fixture ensures all API calls are mocked and never hit real endpoints,
-    preventing accidental modification of customer data.
+    preventing accidental modification of customer data. Responses are plain
+    ``_FakeResp`` objects exposing ``status_code``, ``headers``, ``text``,
+    ``content`` and ``json()``, which is all ``Client`` reads from a response.
     """
     def _create_response(status_code=200, json_data=None, text=None):
-        response = MagicMock()
-        response.status_code = status_code
-        if json_data:
-            response.json.return_value = json_data
-            response.text = json.dumps(json_data)
-        elif text:
-            response.text = text
-            response.json.side_effect = ValueError("Not JSON")
-        else:
-            response.json.return_value = {}
-            response.text = "{}"
-        return response
+        if text is not None and json_data is None:
+            return _FakeResp(status_code, None, text, "text/plain")
+        body = json_data if json_data is not None else {}
+        return _FakeResp(status_code, body, None, "application/json")
     return _create_response
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_calendar():
-    """Sample calendar data."""
-    return {
+    """Sample calendar data (read-only, shared by the session)."""
+    return MappingProxyType({
         "id": "550e8400-e29b-41d4-a716-446655440000",
         "name": "Test Calendar",
         "description": "Test description",
@@ -91,28 +164,67 @@ def sample_calendar():
         "event_count": 0,
         "google_calendar_ids": [],
         "shared_with": [],
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_event():
-    """Sample event data."""
-    return {
+    """Sample event data (read-only, shared by the session)."""
+    return MappingProxyType({
         "id": "660e8400-e29b-41d4-a716-446655440001",
         "name": "Test Event",
         "description": "Test event description",
         "is_active": True,
         "created_at": "2026-01-01T00:00:00Z",
         "updated_at": "2026-01-01T00:00:00Z",
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_user():
-    """Sample user data."""
-    return {
+    """Sample user data (read-only, shared by the session)."""
+    return MappingProxyType({
         "id": "770e8400-e29b-41d4-a716-446655440002",
         "email": "test@example.com",
         "is_active": True,
         "is_verified": True,
-    }
+    })
+
+
+# JWTs encoded once per session. The SDK only reads the payload, so a dummy
+# HS256 secret is enough; timed tokens sit an hour either side of session start.
+_EXP_FUTURE = time.time() + 3600
+_EXP_PAST = time.time() - 3600
+
+def _jwt(**claims):
+    return jwt.encode(claims, "secret", algorithm="HS256")
+
+
+@pytest.fixture(scope="session")
+def permanent_token():
+    """JWT with no ``exp`` claim."""
+    return _jwt(sub="test@example.com")
+
+
+@pytest.fixture(scope="session")
+def valid_token():
+    """JWT expiring an hour after the session starts."""
+    return _jwt(sub="test@example.com", exp=_EXP_FUTURE)
+
+
+@pytest.fixture(scope="session")
+def expired_token():
+    """JWT that expired an hour before the session started."""
+    return _jwt(sub="test@example.com", exp=_EXP_PAST)
+
+
+@pytest.fixture(scope="session")
+def token_a():
+    """Permanent JWT for a first user, for multi-host tests."""
+    return _jwt(sub="test1@example.com")
+
+
+@pytest.fixture(scope="session")
+def token_b():
+    """Permanent JWT for a second user, for multi-host tests."""
+    return _jwt(sub="test2@example.com")
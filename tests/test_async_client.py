@@ -0,0 +1,82 @@
+"""Tests for async client module."""
+
+import asyncio
+import json
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from anymoment.async_client import AsyncClient
+from anymoment.exceptions import NotFoundError
+
+
+API_URL = "https://api.anymoment.sineways.tech"
+
+
+def _make_client(handler, token="test-token"):
+    """Build an AsyncClient whose requests are answered by handler(request)."""
+    client = AsyncClient(api_url=API_URL, token=token, http2=False)
+    client._session = httpx.AsyncClient(
+        base_url=API_URL,
+        headers=dict(client._session.headers),
+        transport=httpx.MockTransport(handler),
+    )
+    return client
+
+
+def test_get_agenda_batch_preserves_order(sample_event):
+    """Test get_agenda_batch returns one agenda per window, in the given order."""
+    seen = []
+    
+    def handler(request):
+        seen.append(request)
+        start = request.url.params["start"]
+        return httpx.Response(200, json=[{"event": dict(sample_event), "start": start}])
+    
+    async def run():
+        async with _make_client(handler) as client:
+            return await client.get_agenda_batch([
+                ("2025-02-03T00:00:00Z", "2025-02-10T00:00:00Z"),
+                ("2025-02-10T00:00:00Z", "2025-02-17T00:00:00Z"),
+            ])
+    
+    result = asyncio.run(run())
+    assert [r[0]["start"] for r in result] == ["2025-02-03T00:00:00Z", "2025-02-10T00:00:00Z"]
+    assert all(r.url.path == "/agenda" for r in seen)
+    assert all(r.headers["x-auth-token"] == "test-token" for r in seen)
+    assert seen[0].url.params["use_cache"] == "true"
+
+
+def test_async_not_found_error():
+    """Test error responses map to the same exceptions as the sync client."""
+    def handler(request):
+        return httpx.Response(404, json={"detail": "Not found"})
+    
+    async def run():
+        async with _make_client(handler) as client:
+            await client.get_event("missing")
+    
+    with pytest.raises(NotFoundError):
+        asyncio.run(run())
+
+
+def test_async_refreshes_token_once_on_401(mock_token_file):
+    """Test a 401 triggers one token refresh shared by concurrent requests."""
+    refreshes = []
+    
+    def handler(request):
+        if request.url.path == "/auth/token/extend":
+            refreshes.append(request)
+            return httpx.Response(200, text='"new-token"')
+        if request.headers["x-auth-token"] != "new-token":
+            return httpx.Response(401, json={"detail": "Token expired"})
+        return httpx.Response(200, json={"id": request.url.path.rsplit("/", 1)[-1]})
+    
+    async def run():
+        async with _make_client(handler, token="old-token") as client:
+            return await client.get_events_batch(["e1", "e2", "e3"])
+    
+    assert asyncio.run(run()) == [{"id": "e1"}, {"id": "e2"}, {"id": "e3"}]
+    assert len(refreshes) == 1
+    assert json.loads(mock_token_file.read_text())
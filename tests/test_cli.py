@@ -1,32 +1,58 @@
 """Tests for CLI commands."""
 
+import json
+from datetime import date, datetime
 from unittest.mock import MagicMock, patch
 
+import click
 import pytest
 from click.testing import CliRunner
 
+from anymoment.cli import commands
 from anymoment.cli.commands import cli, get_client
+from anymoment.client import Client
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def runner():
-    """CLI test runner."""
+    """CLI test runner (stateless between invokes, so shared by the module)."""
     return CliRunner()
 
 
+def call_command(command, **params):
+    """Run a command's callback directly, skipping CliRunner's argv parsing and stream capture.
+    
+    Only for tests that check side effects; use the runner when asserting on output.
+    """
+    with click.Context(command, info_name=command.name):
+        return command.callback(**params)
+
+
+@pytest.fixture(scope="session")
+def _client_template():
+    """One Client-specced mock for the whole session, reset by mock_client before each test.
+    
+    Uses ``MagicMock(spec_set=...)``, not ``create_autospec`` or
+    ``patch(autospec=True)``: spec_set limits attributes to the real class
+    without inspecting every method signature on each construction.
+    """
+    return MagicMock(spec_set=Client)
+
+
 @pytest.fixture
-def mock_client(monkeypatch):
+def mock_client(_client_template, monkeypatch):
     """Mock client for CLI tests.
     
     This fixture ensures get_client() returns a mock client, preventing
     real API calls and token lookups.
     """
-    client = MagicMock()
+    client = _client_template
+    client.reset_mock(return_value=True, side_effect=True)
     # Create a wrapper function that always returns the mock client
     def mock_get_client(*args, **kwargs):
         return client
     # Patch get_client at the module level to ensure it's used everywhere
-    monkeypatch.setattr("anymoment.cli.commands.get_client", mock_get_client)
+    monkeypatch.setattr(commands, "get_client", mock_get_client)
     yield client
 
 
@@ -37,39 +63,54 @@ def test_cli_help(runner):
     assert "AnyMoment CLI" in result.output
 
 
-def test_auth_login(runner, mock_token_file):
+def test_auth_login(runner, mock_token_file, monkeypatch):
     """Test login command."""
     # Use mock_token_file to ensure no real token file is written
+    # Answer the prompts directly instead of feeding stdin through Click's prompt loop
+    monkeypatch.delenv("ANYMOMENT_EMAIL", raising=False)
+    monkeypatch.delenv("ANYMOMENT_PASSWORD", raising=False)
+    answers = {"Email": "test@example.com", "Password": "test-password"}
+    monkeypatch.setattr(click, "prompt", lambda text, **kwargs: answers[text])
     # Patch Client.login to avoid real API calls and token saving
-    with patch("anymoment.cli.commands.Client") as mock_client_class:
+    with patch("anymoment.client.Client") as mock_client_class:
         mock_client = MagicMock()
         mock_client_class.return_value = mock_client
         mock_client.login.return_value = "test-token-123"
         
-        result = runner.invoke(
-            cli,
-            ["auth", "login"],
-            input="test@example.com\ntest-password\n",
-        )
+        result = runner.invoke(cli, ["auth", "login"])
         
         assert result.exit_code == 0
         assert "Login successful" in result.output
-        mock_client.login.assert_called_once()
+        mock_client.login.assert_called_once_with("test@example.com", "test-password")
 
 
-def test_auth_logout(runner, mock_token_file):
+def test_auth_login_from_env(runner, mock_token_file, monkeypatch):
+    """Login reads credentials from the environment without prompting."""
+    monkeypatch.setenv("ANYMOMENT_EMAIL", "test@example.com")
+    monkeypatch.setenv("ANYMOMENT_PASSWORD", "test-password")
+    with patch("anymoment.client.Client") as mock_client_class:
+        mock_client = MagicMock()
+        mock_client_class.return_value = mock_client
+        
+        result = runner.invoke(cli, ["auth", "login"])
+        
+        assert result.exit_code == 0
+        assert "Email:" not in result.output
+        mock_client.login.assert_called_once_with("test@example.com", "test-password")
+
+
+def test_auth_logout(mock_token_file, mock_config_file):
     """Test logout command."""
     # Use mock_token_file to ensure we're not deleting real tokens
-    with patch("anymoment.cli.commands.delete_token") as mock_delete:
-        result = runner.invoke(cli, ["auth", "logout"])
-        assert result.exit_code == 0
-        mock_delete.assert_called_once()
+    with patch("anymoment.token_manager.delete_token") as mock_delete:
+        call_command(commands.logout, host="https://custom.api.com")
+        mock_delete.assert_called_once_with("https://custom.api.com")
 
 
 def test_tokens_list(runner, mock_token_file):
     """Test tokens list command."""
     # Use mock_token_file to ensure we're reading from test data, not real tokens
-    with patch("anymoment.cli.commands.list_tokens") as mock_list:
+    with patch("anymoment.token_manager.list_tokens") as mock_list:
         mock_list.return_value = {
             "https://api.anymoment.sineways.tech": {
                 "expired": False,
@@ -81,21 +122,44 @@ def test_tokens_list(runner, mock_token_file):
         assert "api.anymoment.sineways.tech" in result.output
 
 
-def test_tokens_clear(runner, mock_token_file):
+def test_tokens_list_output(runner, mock_token_file):
+    """Tokens list renders one block per host, including invalid-token notes."""
+    with patch("anymoment.token_manager.list_tokens") as mock_list:
+        mock_list.return_value = {
+            "https://a.example": {"expired": False, "invalid": False, "expires_at": None},
+            "https://b.example": {"expired": True, "invalid": True, "expires_at": None},
+        }
+        result = runner.invoke(cli, ["tokens", "list"])
+    assert result.exit_code == 0
+    assert result.output == (
+        "Cached tokens:\n\n"
+        "  [OK] https://a.example\n    Status: valid\n    Expires: never\n\n"
+        "  [X] https://b.example\n    Status: invalid (not a valid JWT token)\n    Expires: never\n"
+        "    Note: Token appears to be invalid. Please login again.\n\n"
+    )
+
+
+def test_tokens_list_empty(runner, mock_token_file):
+    """Tokens list with no cached tokens points at auth login."""
+    with patch("anymoment.token_manager.list_tokens", return_value={}):
+        result = runner.invoke(cli, ["tokens", "list"])
+    assert result.exit_code == 0
+    assert result.output == "No tokens found.\n  Run 'anymoment auth login' to authenticate.\n"
+
+
+def test_tokens_clear(mock_token_file):
     """Test tokens clear command."""
     # Use mock_token_file to ensure we're not clearing real tokens
-    with patch("anymoment.cli.commands.clear_all_tokens") as mock_clear:
-        result = runner.invoke(cli, ["tokens", "clear"])
-        assert result.exit_code == 0
+    with patch("anymoment.token_manager.clear_all_tokens") as mock_clear:
+        call_command(commands.clear)
         mock_clear.assert_called_once()
 
 
-def test_config_set_url(runner, mock_config_file):
+def test_config_set_url(mock_config_file):
     """Test config set-url command."""
     # Use mock_config_file to ensure we're not modifying real config
     with patch("anymoment.cli.commands.set_config") as mock_set:
-        result = runner.invoke(cli, ["config", "set-url", "https://custom.api.com"])
-        assert result.exit_code == 0
+        call_command(commands.set_url, url="https://custom.api.com")
         mock_set.assert_called_once_with("default_api_url", "https://custom.api.com")
 
 
@@ -113,29 +177,30 @@ def test_config_show(runner, mock_config_file):
     assert "default_api_url" in result.output or "Default Api Url" in result.output
 
 
-def test_calendars_list(runner, mock_client, sample_calendar, mock_token_file):
-    """Test calendars list command."""
+@pytest.mark.parametrize(
+    "cmd,method,sample,as_list,expected",
+    [
+        (["calendars", "list"], "list_calendars", "sample_calendar", True, "Test Calendar"),
+        (["calendars", "get", "550e8400-e29b-41d4-a716-446655440000"], "get_calendar", "sample_calendar", False, "Test Calendar"),
+        (["events", "list"], "list_events", "sample_event", True, "Test Event"),
+        (["users", "me"], "get_user_info", "sample_user", False, "test@example.com"),
+    ],
+)
+def test_read_command(runner, mock_client, mock_token_file, request, cmd, method, sample, as_list, expected):
+    """Read commands render the client's result in human-readable output."""
     # Use mock_token_file to ensure we're not reading real tokens
-    # mock_client fixture already patches get_client, so no real API calls
-    mock_client.list_calendars.return_value = [sample_calendar]
+    data = dict(request.getfixturevalue(sample))
+    getattr(mock_client, method).return_value = [data] if as_list else data
     
-    result = runner.invoke(cli, ["calendars", "list"])
-    if result.exit_code != 0:
-        print(f"\n=== DEBUG INFO ===")
-        print(f"Exit code: {result.exit_code}")
-        print(f"Output:\n{result.output}")
-        if result.exception:
-            print(f"Exception: {result.exception}")
-            import traceback
-            traceback.print_exception(type(result.exception), result.exception, result.exception.__traceback__)
+    result = runner.invoke(cli, cmd)
     assert result.exit_code == 0, f"Command failed with exit code {result.exit_code}. Output: {result.output}"
-    assert "Test Calendar" in result.output
+    assert expected in result.output
 
 
 def test_calendars_create(runner, mock_client, sample_calendar, mock_token_file):
     """Test calendars create command."""
     # Use mock_token_file to ensure we're not reading real tokens
-    mock_client.create_calendar.return_value = sample_calendar
+    mock_client.create_calendar.return_value = dict(sample_calendar)
     
     result = runner.invoke(
         cli,
@@ -145,20 +210,10 @@ def test_calendars_create(runner, mock_client, sample_calendar, mock_token_file)
     mock_client.create_calendar.assert_called_once()
 
 
-def test_calendars_get(runner, mock_client, sample_calendar, mock_token_file):
-    """Test calendars get command."""
-    # Use mock_token_file to ensure we're not reading real tokens
-    mock_client.get_calendar.return_value = sample_calendar
-    
-    result = runner.invoke(cli, ["calendars", "get", "550e8400-e29b-41d4-a716-446655440000"])
-    assert result.exit_code == 0
-    assert "Test Calendar" in result.output
-
-
 def test_events_create(runner, mock_client, sample_event, mock_token_file):
     """Test events create command."""
     # Use mock_token_file to ensure we're not reading real tokens
-    mock_client.create_event_from_text.return_value = sample_event
+    mock_client.create_event_from_text.return_value = dict(sample_event)
     
     result = runner.invoke(
         cli,
@@ -168,35 +223,14 @@ def test_events_create(runner, mock_client, sample_event, mock_token_file):
     mock_client.create_event_from_text.assert_called_once()
 
 
-def test_events_list(runner, mock_client, sample_event, mock_token_file):
-    """Test events list command."""
-    # Use mock_token_file to ensure we're not reading real tokens
-    mock_client.list_events.return_value = [sample_event]
-    
-    result = runner.invoke(cli, ["events", "list"])
-    assert result.exit_code == 0
-    assert "Test Event" in result.output
-
-
-def test_users_me(runner, mock_client, sample_user, mock_token_file):
-    """Test users me command."""
-    # Use mock_token_file to ensure we're not reading real tokens
-    mock_client.get_user_info.return_value = sample_user
-    
-    result = runner.invoke(cli, ["users", "me"])
-    assert result.exit_code == 0
-    assert "test@example.com" in result.output
-
-
 def test_raw_output(runner, mock_client, sample_calendar, mock_token_file):
     """Test --raw output format."""
     # Use mock_token_file to ensure we're not reading real tokens
-    mock_client.list_calendars.return_value = [sample_calendar]
+    mock_client.list_calendars.return_value = [dict(sample_calendar)]
     
     result = runner.invoke(cli, ["calendars", "list", "--raw"])
     assert result.exit_code == 0
     # Should be JSON
-    import json
     data = json.loads(result.output)
     assert isinstance(data, list)
 
@@ -204,7 +238,7 @@ def test_raw_output(runner, mock_client, sample_calendar, mock_token_file):
 def test_pipe_output(runner, mock_client, sample_calendar, mock_token_file):
     """Test --pipe output format."""
     # Use mock_token_file to ensure we're not reading real tokens
-    mock_client.list_calendars.return_value = [sample_calendar]
+    mock_client.list_calendars.return_value = [dict(sample_calendar)]
     
     result = runner.invoke(cli, ["calendars", "list", "--pipe"])
     assert result.exit_code == 0
@@ -254,6 +288,23 @@ def test_agenda_list_with_calendar(runner, mock_client, mock_token_file):
     assert call_kw["calendar_ids"] == ["4032c894-59fc-4126-9975-e75771d9550c"]
 
 
+def test_agenda_list_with_multiple_calendars(runner, mock_client, mock_token_file):
+    """Comma-separated --calendar is split, trimmed, and blanks dropped."""
+    mock_client.get_agenda.return_value = []
+    result = runner.invoke(
+        cli,
+        [
+            "agenda", "list",
+            "--start", "2025-02-03T00:00:00Z",
+            "--end", "2025-02-03T23:59:59Z",
+            "--calendar", "cal-1, cal-2,,",
+        ],
+    )
+    assert result.exit_code == 0
+    call_kw = mock_client.get_agenda.call_args[1]
+    assert call_kw["calendar_ids"] == ["cal-1", "cal-2"]
+
+
 def test_agenda_list_pipe(runner, mock_client, mock_token_file):
     """Agenda list --pipe outputs event IDs only."""
     mock_client.get_agenda.return_value = [
@@ -284,3 +335,79 @@ def test_agenda_search(runner, mock_client, mock_token_file):
     assert call_kw["q"] == "sync"
     assert "Team sync" in result.output
     assert "score" in result.output.lower() or "0.75" in result.output
+
+
+def test_calendars_batch_add_events(runner, mock_client, mock_token_file):
+    """Batch add passes event IDs to the client as a plain list."""
+    mock_client.batch_add_events_to_calendar.return_value = [{"id": "link-1"}, {"id": "link-2"}]
+    result = runner.invoke(cli, ["calendars", "batch-add-events", "cal-1", "ev-1", "ev-2"])
+    assert result.exit_code == 0, result.output
+    call_kw = mock_client.batch_add_events_to_calendar.call_args[1]
+    assert call_kw["event_ids"] == ["ev-1", "ev-2"]
+    assert "Added 2 event(s)" in result.output
+
+
+def test_agenda_list_default_window(runner, mock_client, mock_config_file, monkeypatch):
+    """Agenda list without --start/--end uses today in the default timezone, as UTC."""
+    monkeypatch.setenv("ANYMOMENT_DEFAULT_TIMEZONE", "Not/AZone")
+    mock_client.get_agenda.return_value = []
+    result = runner.invoke(cli, ["agenda", "list"])
+    assert result.exit_code == 0, result.output
+    call_kw = mock_client.get_agenda.call_args[1]
+    today = date.today().isoformat()
+    # Unknown timezone falls back to UTC
+    assert call_kw["start"] == f"{today}T00:00:00Z"
+    assert call_kw["end"] == f"{today}T23:59:59Z"
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_events_export_to_file(runner, mock_client, tmp_path, monkeypatch, use_orjson):
+    """Export writes instances as a JSON array to --out, streaming the stdlib encoder without orjson."""
+    if not use_orjson:
+        monkeypatch.setattr(commands, "orjson", None)
+        # Without orjson the whole document must never be built in memory
+        monkeypatch.setattr(commands, "_dumps_json", None)
+    instances = [
+        {"start": "2025-02-03T09:00:00Z", "end": "2025-02-03T09:30:00Z"},
+        {"start": "2025-02-10T09:00:00Z", "end": "2025-02-10T09:30:00Z"},
+    ]
+    mock_client.get_event_instances.return_value = instances
+    out_file = tmp_path / "instances.json"
+    result = runner.invoke(cli, ["events", "export", "ev-1", "--out", str(out_file)])
+    assert result.exit_code == 0, result.output
+    assert "Exported 2 instance(s)" in result.output
+    assert json.loads(out_file.read_text()) == instances
+
+
+def test_raw_output_without_orjson(runner, mock_client, sample_calendar, monkeypatch):
+    """--raw falls back to stdlib json when orjson is not installed."""
+    monkeypatch.setattr(commands, "orjson", None)
+    mock_client.list_calendars.return_value = [dict(sample_calendar)]
+    result = runner.invoke(cli, ["calendars", "list", "--raw"])
+    assert result.exit_code == 0
+    assert json.loads(result.output) == [sample_calendar]
+
+
+def test_raw_output_serializes_datetimes_as_iso(runner, mock_client, monkeypatch):
+    """--raw encodes datetime values as ISO 8601 with or without orjson."""
+    mock_client.get_user_info.return_value = {"id": "u-1", "created_at": datetime(2026, 1, 1, 9, 30)}
+    for fast in (True, False):
+        if not fast:
+            monkeypatch.setattr(commands, "orjson", None)
+        result = runner.invoke(cli, ["users", "me", "--raw"])
+        assert result.exit_code == 0
+        assert json.loads(result.output)["created_at"] == "2026-01-01T09:30:00"
+
+
+def test_agenda_bounds_named_timezone():
+    """Default agenda bounds convert local midnight to UTC, honouring DST."""
+    from anymoment.cli.commands import _agenda_bounds
+    
+    assert _agenda_bounds("America/New_York", date(2025, 1, 15)) == (
+        "2025-01-15T05:00:00Z",
+        "2025-01-16T04:59:59Z",
+    )
+    assert _agenda_bounds("America/New_York", date(2025, 7, 15)) == (
+        "2025-07-15T04:00:00Z",
+        "2025-07-16T03:59:59Z",
+    )
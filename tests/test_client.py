@@ -1,19 +1,55 @@
 """Tests for client module."""
 
+import json
 from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
 import pytest
-import requests
+from requests import Session as _RealSession  # bound before the module-wide Session patch
+from requests.exceptions import ChunkedEncodingError, ConnectionError as RequestsConnectionError
 
-from anymoment.client import Client
+from anymoment.client import Client, _CircuitBreaker
 from anymoment.exceptions import (
+    AnyMomentException,
     AuthenticationError,
     NotFoundError,
     ServerError,
     ValidationError,
 )
 
+API_URL = "https://api.anymoment.sineways.tech"
+
+# Expected wire form of the 2025-02-03 .. 2025-02-09 agenda window built from datetimes
+_START_UTC_ISO = "2025-02-03T00:00:00+00:00"
+_END_UTC_ISO = "2025-02-09T23:59:59+00:00"
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _session_class():
+    """Patch requests.Session once for the whole module so no test can reach the network."""
+    with patch("anymoment.client.requests.Session") as session_class:
+        yield session_class
+
+
+@pytest.fixture(autouse=True)
+def mock_session(_session_class):
+    """Fresh mock session per test: what the next Client() gets from requests.Session()."""
+    _session_class.side_effect = None
+    _session_class.return_value = session = MagicMock()
+    return session
+
+
+@pytest.fixture
+def client(mock_session):
+    """Client for the default API URL with a test token, talking to mock_session."""
+    return Client(api_url=API_URL, token="test-token")
+
+
+@pytest.fixture
+def real_session(_session_class):
+    """Let Client() build a real requests.Session, for tests of its adapter and headers."""
+    _session_class.side_effect = _RealSession
+
 
 def test_client_init_default(mock_config_file):
     """Test client initialization with default URL."""
@@ -37,13 +73,9 @@ def test_client_init_with_token(mock_config_file):
     assert client._token == token
 
 
-@patch("anymoment.client.requests.Session")
 @patch("anymoment.client.save_token")
-def test_login_success(mock_save_token, mock_session_class, mock_api_response):
+def test_login_success(mock_save_token, mock_session, mock_api_response):
     """Test successful login."""
-    mock_session = MagicMock()
-    mock_session_class.return_value = mock_session
-    
     response = mock_api_response(status_code=200, text='"test-token-123"')
     mock_session.post.return_value = response
     
@@ -56,13 +88,9 @@ def test_login_success(mock_save_token, mock_session_class, mock_api_response):
     mock_save_token.assert_called_once_with("https://api.anymoment.sineways.tech", "test-token-123")
 
 
-@patch("anymoment.client.requests.Session")
 @patch("anymoment.client.save_token")
-def test_login_failure(mock_save_token, mock_session_class, mock_api_response):
+def test_login_failure(mock_save_token, mock_session, mock_api_response):
     """Test login failure."""
-    mock_session = MagicMock()
-    mock_session_class.return_value = mock_session
-    
     response = mock_api_response(status_code=401, json_data={"detail": "Invalid credentials"})
     mock_session.post.return_value = response
     
@@ -75,144 +103,98 @@ def test_login_failure(mock_save_token, mock_session_class, mock_api_response):
     mock_save_token.assert_not_called()
 
 
-@patch("anymoment.client.requests.Session")
-def test_get_user_info(mock_session_class, mock_api_response, sample_user):
+def test_get_user_info(mock_session, mock_api_response, sample_user, client):
     """Test getting user info."""
-    mock_session = MagicMock()
-    mock_session_class.return_value = mock_session
-    
     response = mock_api_response(status_code=200, json_data=sample_user)
     mock_session.request.return_value = response
     
-    client = Client(api_url="https://api.anymoment.sineways.tech", token="test-token")
     user = client.get_user_info()
     
     assert user == sample_user
     mock_session.request.assert_called_once()
 
 
-@patch("anymoment.client.requests.Session")
-def test_list_calendars(mock_session_class, mock_api_response, sample_calendar):
+def test_list_calendars(mock_session, mock_api_response, sample_calendar, client):
     """Test listing calendars."""
-    mock_session = MagicMock()
-    mock_session_class.return_value = mock_session
-    
     response = mock_api_response(status_code=200, json_data=[sample_calendar])
     mock_session.request.return_value = response
     
-    client = Client(api_url="https://api.anymoment.sineways.tech", token="test-token")
     calendars = client.list_calendars()
     
     assert len(calendars) == 1
     assert calendars[0] == sample_calendar
 
 
-@patch("anymoment.client.requests.Session")
-def test_create_calendar(mock_session_class, mock_api_response, sample_calendar):
+def test_create_calendar(mock_session, mock_api_response, sample_calendar, client):
     """Test creating a calendar."""
-    mock_session = MagicMock()
-    mock_session_class.return_value = mock_session
-    
     response = mock_api_response(status_code=201, json_data=sample_calendar)
     mock_session.request.return_value = response
     
-    client = Client(api_url="https://api.anymoment.sineways.tech", token="test-token")
     calendar = client.create_calendar(name="Test Calendar", timezone="UTC")
     
     assert calendar == sample_calendar
     mock_session.request.assert_called_once()
 
 
-@patch("anymoment.client.requests.Session")
-def test_get_calendar(mock_session_class, mock_api_response, sample_calendar):
+def test_get_calendar(mock_session, mock_api_response, sample_calendar, client):
     """Test getting a calendar."""
-    mock_session = MagicMock()
-    mock_session_class.return_value = mock_session
-    
     response = mock_api_response(status_code=200, json_data=sample_calendar)
     mock_session.request.return_value = response
     
-    client = Client(api_url="https://api.anymoment.sineways.tech", token="test-token")
     calendar = client.get_calendar("550e8400-e29b-41d4-a716-446655440000")
     
     assert calendar == sample_calendar
 
 
-@patch("anymoment.client.requests.Session")
-def test_not_found_error(mock_session_class, mock_api_response):
-    """Test handling 404 errors."""
-    mock_session = MagicMock()
-    mock_session_class.return_value = mock_session
-    
-    response = mock_api_response(status_code=404, json_data={"detail": "Not found"})
-    mock_session.request.return_value = response
-    
-    client = Client(api_url="https://api.anymoment.sineways.tech", token="test-token")
-    
-    with pytest.raises(NotFoundError):
-        client.get_calendar("invalid-id")
-
-
-@patch("anymoment.client.requests.Session")
-def test_validation_error(mock_session_class, mock_api_response):
-    """Test handling 400 errors."""
-    mock_session = MagicMock()
-    mock_session_class.return_value = mock_session
-    
-    response = mock_api_response(status_code=400, json_data={"detail": "Validation error"})
+@pytest.mark.parametrize(
+    "status,exc,method,kwargs",
+    [
+        (404, NotFoundError, "get_calendar", {"calendar_id": "invalid-id"}),
+        (400, ValidationError, "create_calendar", {"name": "", "timezone": "UTC"}),
+        (500, ServerError, "list_calendars", {}),
+    ],
+)
+def test_error_mapping(mock_session, mock_api_response, client, status, exc, method, kwargs):
+    """Test 4xx/5xx responses raise the matching exception with the server's detail."""
+    response = mock_api_response(status_code=status, json_data={"detail": "Boom"})
     mock_session.request.return_value = response
     
-    client = Client(api_url="https://api.anymoment.sineways.tech", token="test-token")
-    
-    with pytest.raises(ValidationError):
-        client.create_calendar(name="", timezone="UTC")
+    with pytest.raises(exc, match="Boom") as exc_info:
+        getattr(client, method)(**kwargs)
+    assert exc_info.value.status_code == status
 
 
-@patch("anymoment.client.requests.Session")
-def test_server_error(mock_session_class, mock_api_response):
-    """Test handling 500 errors."""
-    mock_session = MagicMock()
-    mock_session_class.return_value = mock_session
-    
-    response = mock_api_response(status_code=500, json_data={"detail": "Server error"})
+def test_non_json_success_returns_text(mock_session, mock_api_response, client):
+    """Test 2xx responses without a JSON content type are returned as text."""
+    response = mock_api_response(status_code=204, text="")
+    del response.headers["Content-Type"]
     mock_session.request.return_value = response
     
-    client = Client(api_url="https://api.anymoment.sineways.tech", token="test-token")
-    
-    with pytest.raises(ServerError):
-        client.list_calendars()
+    assert client.delete_calendar("cal-1") is None
+    assert client._handle_response(mock_api_response(status_code=200, text="ok")) == "ok"
 
 
-@patch("anymoment.client.requests.Session")
-def test_create_event_from_text(mock_session_class, mock_api_response, sample_event):
+def test_create_event_from_text(mock_session, mock_api_response, sample_event, client):
     """Test creating an event from natural language."""
-    mock_session = MagicMock()
-    mock_session_class.return_value = mock_session
-    
     response = mock_api_response(status_code=201, json_data=sample_event)
     mock_session.request.return_value = response
     
-    client = Client(api_url="https://api.anymoment.sineways.tech", token="test-token")
     event = client.create_event_from_text("Every Monday at 10 AM")
     
     assert event == sample_event
     # Verify the request was made with correct data
     call_args = mock_session.request.call_args
-    assert call_args[1]["json"]["recurrence_text"] == "Every Monday at 10 AM"
+    assert json.loads(call_args[1]["data"])["recurrence_text"] == "Every Monday at 10 AM"
 
 
-@patch("anymoment.client.requests.Session")
-def test_get_agenda(mock_session_class, mock_api_response):
+def test_get_agenda(mock_session, mock_api_response, client):
     """Test get_agenda: path, params (start/end ISO), return value."""
-    mock_session = MagicMock()
-    mock_session_class.return_value = mock_session
     agenda_response = [
         {"event": {"id": "ev-1", "name": "Meeting"}, "instances": [{"start": "2025-02-03T09:00:00Z", "end": "2025-02-03T10:00:00Z", "is_all_day": False}]}
     ]
     response = mock_api_response(status_code=200, json_data=agenda_response)
     mock_session.request.return_value = response
 
-    client = Client(api_url="https://api.anymoment.sineways.tech", token="test-token")
     result = client.get_agenda(start="2025-02-03T00:00:00Z", end="2025-02-09T23:59:59Z")
 
     assert result == agenda_response
@@ -221,55 +203,43 @@ def test_get_agenda(mock_session_class, mock_api_response):
     assert call_kw["method"] == "GET"
     assert call_kw["params"]["start"] == "2025-02-03T00:00:00Z"
     assert call_kw["params"]["end"] == "2025-02-09T23:59:59Z"
-    assert call_kw["params"]["use_cache"] is True
+    assert call_kw["params"]["use_cache"] == "true"
     assert call_kw["url"].endswith("/agenda") or "/agenda" in call_kw["url"]
 
 
-@patch("anymoment.client.requests.Session")
-def test_get_agenda_datetime_naive_serialized_as_utc(mock_session_class, mock_api_response):
+def test_get_agenda_datetime_naive_serialized_as_utc(mock_session, mock_api_response, client):
     """Test get_agenda with naive datetime: serialized params are UTC (Z)."""
-    mock_session = MagicMock()
-    mock_session_class.return_value = mock_session
     response = mock_api_response(status_code=200, json_data=[])
     mock_session.request.return_value = response
 
-    client = Client(api_url="https://api.anymoment.sineways.tech", token="test-token")
     start_dt = datetime(2025, 2, 3, 0, 0, 0)
     end_dt = datetime(2025, 2, 9, 23, 59, 59)
     client.get_agenda(start=start_dt, end=end_dt)
 
     call_kw = mock_session.request.call_args[1]
-    assert "Z" in call_kw["params"]["start"] or "+00:00" in call_kw["params"]["start"]
-    assert "Z" in call_kw["params"]["end"] or "+00:00" in call_kw["params"]["end"]
+    assert call_kw["params"]["start"] == _START_UTC_ISO
+    assert call_kw["params"]["end"] == _END_UTC_ISO
 
 
-@patch("anymoment.client.requests.Session")
-def test_get_agenda_datetime_aware(mock_session_class, mock_api_response):
+def test_get_agenda_datetime_aware(mock_session, mock_api_response, client):
     """Test get_agenda with timezone-aware datetime: serialized params are ISO with offset."""
-    mock_session = MagicMock()
-    mock_session_class.return_value = mock_session
     response = mock_api_response(status_code=200, json_data=[])
     mock_session.request.return_value = response
 
-    client = Client(api_url="https://api.anymoment.sineways.tech", token="test-token")
     start_dt = datetime(2025, 2, 3, 0, 0, 0, tzinfo=timezone.utc)
     end_dt = datetime(2025, 2, 9, 23, 59, 59, tzinfo=timezone.utc)
     client.get_agenda(start=start_dt, end=end_dt)
 
     call_kw = mock_session.request.call_args[1]
-    assert "2025-02-03" in call_kw["params"]["start"]
-    assert "2025-02-09" in call_kw["params"]["end"]
+    assert call_kw["params"]["start"] == _START_UTC_ISO
+    assert call_kw["params"]["end"] == _END_UTC_ISO
 
 
-@patch("anymoment.client.requests.Session")
-def test_get_agenda_with_calendar_ids(mock_session_class, mock_api_response):
+def test_get_agenda_with_calendar_ids(mock_session, mock_api_response, client):
     """Test get_agenda with calendar_ids and use_cache=False."""
-    mock_session = MagicMock()
-    mock_session_class.return_value = mock_session
     response = mock_api_response(status_code=200, json_data=[])
     mock_session.request.return_value = response
 
-    client = Client(api_url="https://api.anymoment.sineways.tech", token="test-token")
     client.get_agenda(
         start="2025-02-03T00:00:00Z",
         end="2025-02-09T23:59:59Z",
@@ -280,22 +250,18 @@ def test_get_agenda_with_calendar_ids(mock_session_class, mock_api_response):
 
     call_kw = mock_session.request.call_args[1]
     assert call_kw["params"]["calendar_ids"] == ["cal-1", "cal-2"]
-    assert call_kw["params"]["use_cache"] is False
-    assert call_kw["params"]["include_webhooks"] is True
+    assert call_kw["params"]["use_cache"] == "false"
+    assert call_kw["params"]["include_webhooks"] == "true"
 
 
-@patch("anymoment.client.requests.Session")
-def test_search_events(mock_session_class, mock_api_response):
+def test_search_events(mock_session, mock_api_response, client):
     """Test search_events: path, params (q required), return value."""
-    mock_session = MagicMock()
-    mock_session_class.return_value = mock_session
     search_response = [
         {"event": {"id": "ev-1", "name": "Team meeting"}, "score": 0.85, "instances": None}
     ]
     response = mock_api_response(status_code=200, json_data=search_response)
     mock_session.request.return_value = response
 
-    client = Client(api_url="https://api.anymoment.sineways.tech", token="test-token")
     result = client.search_events(q="meeting")
 
     assert result == search_response
@@ -304,19 +270,15 @@ def test_search_events(mock_session_class, mock_api_response):
     assert call_kw["params"]["q"] == "meeting"
     assert call_kw["params"]["limit"] == 50
     assert call_kw["params"]["offset"] == 0
-    assert call_kw["params"]["include_instances"] is True
+    assert call_kw["params"]["include_instances"] == "true"
     assert "/agenda/search" in call_kw["url"]
 
 
-@patch("anymoment.client.requests.Session")
-def test_search_events_with_filters(mock_session_class, mock_api_response):
+def test_search_events_with_filters(mock_session, mock_api_response, client):
     """Test search_events with start, end, calendar_ids, is_active, limit, offset."""
-    mock_session = MagicMock()
-    mock_session_class.return_value = mock_session
     response = mock_api_response(status_code=200, json_data=[])
     mock_session.request.return_value = response
 
-    client = Client(api_url="https://api.anymoment.sineways.tech", token="test-token")
     client.search_events(
         q="standup",
         start="2025-02-01T00:00:00Z",
@@ -333,7 +295,248 @@ def test_search_events_with_filters(mock_session_class, mock_api_response):
     assert call_kw["params"]["start"] == "2025-02-01T00:00:00Z"
     assert call_kw["params"]["end"] == "2025-02-28T23:59:59Z"
     assert call_kw["params"]["calendar_ids"] == ["cal-1"]
-    assert call_kw["params"]["is_active"] is True
+    assert call_kw["params"]["is_active"] == "true"
     assert call_kw["params"]["limit"] == 10
     assert call_kw["params"]["offset"] == 5
-    assert call_kw["params"]["include_instances"] is False
+    assert call_kw["params"]["include_instances"] == "false"
+
+
+def test_client_mounts_pooled_adapter(mock_config_file, real_session):
+    """Test the session uses an HTTPAdapter sized by pool_size."""
+    client = Client(api_url="https://api.anymoment.sineways.tech", pool_size=32)
+    adapter = client._session.get_adapter("https://api.anymoment.sineways.tech/agenda")
+    assert adapter._pool_maxsize == 32
+    assert adapter._pool_connections == 32
+
+
+def test_client_adapter_retries_connection_errors(mock_config_file, real_session):
+    """Test connection-level retries are configured on the adapter, status retries are not."""
+    client = Client(api_url="https://api.anymoment.sineways.tech", max_retries=2)
+    retry = client._session.get_adapter("https://api.anymoment.sineways.tech").max_retries
+    assert retry.connect == 2
+    assert retry.read == 2
+    assert retry.status == 0
+    assert "POST" not in retry.allowed_methods
+
+
+@patch("anymoment.client.get_token", return_value="stored-token")
+def test_auth_header_set_once_on_session(mock_get_token, mock_config_file, mock_api_response, real_session):
+    """Test the stored token is looked up once and then sent via session headers."""
+    client = Client(api_url="https://api.anymoment.sineways.tech")
+    with patch.object(client._session, "request", return_value=mock_api_response(json_data={})) as mock_request:
+        client.get_user_info()
+        client.list_calendars()
+    
+    assert mock_get_token.call_count == 1
+    assert client._session.headers["x-auth-token"] == "stored-token"
+    assert client._session.headers["Content-Type"] == "application/json"
+    assert "headers" not in mock_request.call_args[1]
+
+
+@patch("anymoment.client.time.sleep")
+def test_retries_transient_errors_on_get(mock_sleep, mock_session, mock_api_response, sample_calendar, client):
+    """Test GET is retried on 503 and 429, then succeeds."""
+    mock_session.request.side_effect = [
+        mock_api_response(status_code=503, json_data={"detail": "Unavailable"}),
+        mock_api_response(status_code=429, json_data={"detail": "Slow down"}),
+        mock_api_response(status_code=200, json_data=sample_calendar),
+    ]
+    
+    assert client.get_calendar("cal-1") == sample_calendar
+    assert mock_session.request.call_count == 3
+    assert mock_sleep.call_count == 2
+
+
+@patch("anymoment.client.time.sleep")
+def test_retries_exhausted_raises_server_error(mock_sleep, mock_session, mock_api_response):
+    """Test the last transient response is surfaced once retries run out."""
+    mock_session.request.return_value = mock_api_response(status_code=502, json_data={"detail": "Bad gateway"})
+    
+    client = Client(api_url="https://api.anymoment.sineways.tech", token="test-token", max_retries=2)
+    with pytest.raises(ServerError):
+        client.list_calendars()
+    assert mock_session.request.call_count == 3
+
+
+@patch("anymoment.client.time.sleep")
+def test_post_not_retried_on_bad_gateway(mock_sleep, mock_session, mock_api_response, client):
+    """Test non-idempotent POST is not retried when the server may have processed it."""
+    mock_session.request.return_value = mock_api_response(status_code=502, json_data={"detail": "Bad gateway"})
+    
+    with pytest.raises(ServerError):
+        client.create_event_from_text("Every Monday at 10 AM")
+    assert mock_session.request.call_count == 1
+    mock_sleep.assert_not_called()
+
+
+def test_backoff_delay_honours_retry_after(mock_config_file):
+    """Test Retry-After sets a floor on the jittered delay, capped at max_backoff."""
+    client = Client(api_url="https://api.anymoment.sineways.tech", base_backoff=0.1, max_backoff=10.0)
+    assert 0 <= client._backoff_delay(0) <= 0.1
+    assert client._backoff_delay(0, "2") >= 2
+    assert client._backoff_delay(0, "600") == 10.0
+    assert client._backoff_delay(0, "Wed, 21 Oct 2015 07:28:00 GMT") <= 0.1
+
+
+@patch("anymoment.client.time.monotonic")
+def test_circuit_breaker_fails_fast_then_probes(mock_monotonic, mock_session, mock_api_response, sample_calendar):
+    """Test repeated 5xx opens the breaker, and a probe after the cooldown closes it."""
+    mock_session.request.return_value = mock_api_response(status_code=500, json_data={"detail": "Server error"})
+    mock_monotonic.return_value = 100.0
+    
+    client = Client(
+        api_url="https://api.anymoment.sineways.tech",
+        token="test-token",
+        failure_threshold=2,
+        recovery_timeout=30.0,
+    )
+    for _ in range(2):
+        with pytest.raises(ServerError):
+            client.list_calendars()
+    assert mock_session.request.call_count == 2
+    
+    # Open: fails without sending
+    with pytest.raises(ServerError):
+        client.list_calendars()
+    assert mock_session.request.call_count == 2
+    
+    # After the cooldown a probe goes through and success closes the breaker
+    mock_monotonic.return_value = 131.0
+    mock_session.request.return_value = mock_api_response(status_code=200, json_data=[sample_calendar])
+    assert client.list_calendars() == [sample_calendar]
+    assert client._breaker.state == "closed"
+
+
+@patch("anymoment.client.time.monotonic")
+def test_circuit_breaker_half_open_allows_single_probe(mock_monotonic):
+    """Test only one caller is let through after the cooldown until the probe is recorded."""
+    mock_monotonic.return_value = 100.0
+    breaker = _CircuitBreaker(failure_threshold=1, recovery_timeout=30.0)
+    breaker.record_failure()
+    
+    mock_monotonic.return_value = 131.0
+    assert breaker.allow() is True
+    assert breaker.allow() is False
+    breaker.record_success()
+    assert breaker.allow() is True
+
+
+def test_circuit_breaker_probe_released_on_other_errors(
+    mock_config_file, mock_session, mock_api_response, sample_calendar
+):
+    """Test a probe that raises a non-transport RequestException does not keep the breaker shut."""
+    mock_session.request.side_effect = [
+        mock_api_response(status_code=500, json_data={"detail": "Server error"}),
+        ChunkedEncodingError("truncated body"),
+        mock_api_response(status_code=200, json_data=[sample_calendar]),
+    ]
+    client = Client(
+        api_url="https://api.anymoment.sineways.tech",
+        token="test-token",
+        failure_threshold=1,
+        recovery_timeout=0,
+    )
+    with pytest.raises(ServerError):
+        client.list_calendars()
+    with pytest.raises(AnyMomentException):
+        client.list_calendars()
+    
+    assert client.list_calendars() == [sample_calendar]
+    assert client._breaker.state == "closed"
+
+
+def test_circuit_breaker_records_resend_after_refresh(
+    mock_config_file, memory_token_store, mock_session, mock_api_response, valid_token
+):
+    """Test the resend after a token refresh is recorded with the breaker."""
+    mock_session.request.side_effect = [
+        mock_api_response(status_code=401, json_data={"detail": "Expired"}),
+        mock_api_response(status_code=500, json_data={"detail": "Server error"}),
+    ]
+    mock_session.get.return_value = mock_api_response(status_code=200, text=f'"{valid_token}"')
+    
+    client = Client(api_url="https://api.anymoment.sineways.tech", token=valid_token, failure_threshold=1)
+    with pytest.raises(ServerError):
+        client.list_calendars()
+    assert client._breaker.state == "open"
+
+
+def test_get_agenda_rejects_unsupported_window_type(mock_config_file, client):
+    """Test start/end that are neither str nor datetime raise TypeError before any request."""
+    with pytest.raises(TypeError):
+        client.get_agenda(start=1738540800, end="2025-02-09T23:59:59Z")
+
+
+def test_http2_session_uses_httpx(mock_token_file):
+    """Test Client(http2=True) sends through httpx and keeps Client's header and error handling."""
+    httpx = pytest.importorskip("httpx")
+    pytest.importorskip("h2")
+    seen = []
+    
+    def handler(request):
+        seen.append(request)
+        if request.url.path == "/auth/token":
+            return httpx.Response(200, text='"new-token"')
+        if request.url.path == "/calendars/down":
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(200, json=[{"id": "cal-1"}])
+    
+    client = Client(api_url="https://api.anymoment.sineways.tech", token="test-token", http2=True)
+    client._session._client = httpx.Client(
+        transport=httpx.MockTransport(handler),
+        headers=client._session.headers,
+    )
+    
+    assert client.list_calendars() == [{"id": "cal-1"}]
+    assert seen[-1].headers["x-auth-token"] == "test-token"
+    assert client.login("user@example.com", "password") == "new-token"
+    assert "x-auth-token" not in seen[-1].headers
+    assert json.loads(seen[-1].content) == {"email": "user@example.com", "password": "password"}
+    with pytest.raises(AnyMomentException, match="Request failed"):
+        client.get_calendar("down")
+
+
+@pytest.mark.parametrize("error", ["RemoteProtocolError", "ReadError"])
+def test_http2_session_maps_dropped_streams_to_connection_error(mock_token_file, error):
+    """Test httpx stream/read failures surface as ConnectionError, chained to the httpx error."""
+    httpx = pytest.importorskip("httpx")
+    pytest.importorskip("h2")
+    
+    def handler(request):
+        raise getattr(httpx, error)("stream reset", request=request)
+    
+    client = Client(api_url="https://api.anymoment.sineways.tech", token="test-token", http2=True)
+    client._session._client = httpx.Client(transport=httpx.MockTransport(handler))
+    
+    with pytest.raises(RequestsConnectionError) as excinfo:
+        client._session.request("GET", "https://api.anymoment.sineways.tech/calendars")
+    assert isinstance(excinfo.value.__cause__, getattr(httpx, error))
+
+
+def test_iter_agenda_chunks_window(mock_session, mock_api_response, sample_event, client):
+    """Test iter_agenda splits the window into chunk_days requests and yields their items."""
+    mock_session.request.return_value = mock_api_response(
+        status_code=200, json_data=[{"event": sample_event, "instances": []}]
+    )
+    
+    items = list(client.iter_agenda("2025-02-01T00:00:00Z", "2025-02-20T00:00:00Z", chunk_days=7))
+    
+    assert len(items) == 3
+    windows = [(c[1]["params"]["start"], c[1]["params"]["end"]) for c in mock_session.request.call_args_list]
+    assert windows == [
+        ("2025-02-01T00:00:00+00:00", "2025-02-08T00:00:00+00:00"),
+        ("2025-02-08T00:00:00+00:00", "2025-02-15T00:00:00+00:00"),
+        ("2025-02-15T00:00:00+00:00", "2025-02-20T00:00:00+00:00"),
+    ]
+
+
+def test_non_json_error_body_uses_text(mock_session, mock_api_response):
+    """Test a plain-text error page (e.g. from a proxy) becomes the message without a JSON parse attempt."""
+    response = mock_api_response(status_code=502, text="Bad Gateway")
+    mock_session.request.return_value = response
+    
+    client = Client(api_url="https://api.anymoment.sineways.tech", token="test-token", max_retries=0)
+    
+    with patch("anymoment.client._json.loads", side_effect=AssertionError("parsed as JSON")):
+        with pytest.raises(ServerError, match="Bad Gateway"):
+            client.list_calendars()
@@ -0,0 +1,81 @@
+"""Tests for config module."""
+
+import json
+import os
+
+import pytest
+
+from anymoment.config import _config_file, get_config, load_config, save_config, set_config
+
+
+def test_load_config_defaults(mock_config_file):
+    """Test defaults are returned when no config file exists."""
+    config = load_config()
+    assert config["default_api_url"] == "https://api.anymoment.sineways.tech"
+    assert config["default_timezone"] == "UTC"
+    assert config["default_calendar_id"] is None
+
+
+def test_load_config_cached_until_mtime_changes(mock_config_file):
+    """Test config is re-read only when the file changes on disk."""
+    save_config({"default_timezone": "UTC"})
+    assert get_config("default_timezone") == "UTC"
+    
+    # Rewrite the file behind the cache's back, keeping the same mtime
+    stat = mock_config_file.stat()
+    mock_config_file.write_text(json.dumps({"default_timezone": "Europe/Paris"}))
+    os.utime(mock_config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert get_config("default_timezone") == "UTC"
+    
+    # Bump the mtime and the new value is picked up
+    os.utime(mock_config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert get_config("default_timezone") == "Europe/Paris"
+
+
+def test_set_config_invalidates_cache(mock_config_file):
+    """Test set_config is visible to the next read."""
+    set_config("default_calendar_id", "cal-1")
+    assert get_config("default_calendar_id") == "cal-1"
+    set_config("default_calendar_id", "cal-2")
+    assert get_config("default_calendar_id") == "cal-2"
+
+
+def test_load_config_returns_copy(mock_config_file):
+    """Test mutating the returned dict does not poison the cache."""
+    set_config("default_timezone", "UTC")
+    config = load_config()
+    config["default_timezone"] = "Asia/Tokyo"
+    assert get_config("default_timezone") == "UTC"
+
+
+def test_load_config_does_not_create_dir(mock_config_file, tmp_path, monkeypatch):
+    """Test reading config without a config dir returns defaults and creates nothing."""
+    config_dir = tmp_path / ".anymoment"
+    monkeypatch.setattr("anymoment.config.CONFIG_DIR", config_dir)
+    # mock_config_file clears the path cache again on teardown
+    _config_file.cache_clear()
+    
+    assert load_config()["default_timezone"] == "UTC"
+    assert not config_dir.exists()
+    
+    set_config("default_timezone", "Europe/Paris")
+    assert get_config("default_timezone") == "Europe/Paris"
+
+
+def test_config_file_attribute_tracks_config_dir(mock_config_file):
+    """Test the legacy CONFIG_FILE attribute still resolves to the current config path."""
+    from anymoment import config
+    
+    assert config.CONFIG_FILE == mock_config_file
+    with pytest.raises(AttributeError):
+        config.NO_SUCH_SETTING
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_save_config_round_trip(mock_config_file, monkeypatch, use_orjson):
+    """Test config written with orjson or the stdlib fallback reads back the same."""
+    if not use_orjson:
+        monkeypatch.setattr("anymoment._json.orjson", None)
+    save_config({"default_timezone": "Europe/Zürich", "default_calendar_id": None})
+    assert json.loads(mock_config_file.read_text(encoding="utf-8"))["default_timezone"] == "Europe/Zürich"
+    assert load_config()["default_timezone"] == "Europe/Zürich"
@@ -1,41 +1,46 @@
 """Tests for token_manager module."""
 
+import hashlib
 import json
-import time
-from datetime import datetime, timedelta, timezone
+import subprocess
+import sys
+from unittest.mock import patch
 
 import jwt
 import pytest
 
 from anymoment.exceptions import TokenError
 from anymoment.token_manager import (
+    _get_fernet,
+    _get_legacy_fernet,
+    _invalidate_cache,
+    _is_token_expired,
+    _jwt_exp,
     clear_all_tokens,
     delete_token,
     get_token,
     list_tokens,
     save_token,
+    transaction,
 )
 
 
-def test_save_and_get_token(mock_token_file):
+def test_save_and_get_token(memory_token_store, permanent_token):
     """Test saving and retrieving a token."""
     host_url = "https://api.anymoment.sineways.tech"
-    # Use a valid JWT token format for testing
-    import jwt
-    token = jwt.encode({"sub": "test@example.com"}, "secret", algorithm="HS256")
+    token = permanent_token
     
     save_token(host_url, token)
     retrieved = get_token(host_url)
     
     assert retrieved == token
+    assert memory_token_store["index"][host_url]["token"] != token
 
 
-def test_token_encryption(mock_token_file):
+def test_token_encryption(mock_token_file, permanent_token):
     """Test that tokens are encrypted in storage."""
     host_url = "https://api.anymoment.sineways.tech"
-    # Use a valid JWT token format for testing
-    import jwt
-    token = jwt.encode({"sub": "test@example.com"}, "secret", algorithm="HS256")
+    token = permanent_token
     
     save_token(host_url, token)
     
@@ -48,127 +53,370 @@ def test_token_encryption(mock_token_file):
     assert isinstance(data[host_url]["token"], str)
 
 
-def test_multiple_hosts(mock_token_file):
+def test_token_file_attribute_tracks_token_dir(mock_token_file):
+    """Test the legacy TOKEN_FILE attribute still resolves to the current token path."""
+    from anymoment import token_manager
+    
+    assert token_manager.TOKEN_FILE == mock_token_file
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_token_file_json_backends(mock_token_file, monkeypatch, permanent_token, use_orjson):
+    """Test the token file round-trips with orjson or the stdlib fallback, and corrupt JSON raises TokenError."""
+    if not use_orjson:
+        monkeypatch.setattr("anymoment._json.orjson", None)
+    host_url = "https://api.anymoment.sineways.tech"
+    
+    save_token(host_url, permanent_token)
+    assert json.loads(mock_token_file.read_text(encoding="utf-8")).keys() == {host_url}
+    _invalidate_cache()
+    assert get_token(host_url) == permanent_token
+    
+    mock_token_file.write_text("{not json", encoding="utf-8")
+    _invalidate_cache()
+    with pytest.raises(TokenError):
+        get_token(host_url)
+
+
+def test_multiple_hosts(memory_token_store, token_a, token_b):
     """Test storing tokens for multiple hosts."""
-    import jwt
     host1 = "https://api.anymoment.sineways.tech"
     host2 = "https://dev.api.anymoment.sineways.tech"
-    token1 = jwt.encode({"sub": "test1@example.com"}, "secret", algorithm="HS256")
-    token2 = jwt.encode({"sub": "test2@example.com"}, "secret", algorithm="HS256")
+    token1, token2 = token_a, token_b
     
-    save_token(host1, token1)
-    save_token(host2, token2)
+    with transaction() as tokens:
+        tokens[host1] = token1
+        tokens[host2] = token2
     
+    assert memory_token_store["mtime"] == 1  # one write for both hosts
     assert get_token(host1) == token1
     assert get_token(host2) == token2
 
 
-def test_delete_token(mock_token_file):
-    """Test deleting a token."""
-    import jwt
-    host_url = "https://api.anymoment.sineways.tech"
-    token = jwt.encode({"sub": "test@example.com"}, "secret", algorithm="HS256")
-    
-    save_token(host_url, token)
-    assert get_token(host_url) == token
-    
-    delete_token(host_url)
-    assert get_token(host_url) is None
-
-
-def test_clear_all_tokens(mock_token_file):
-    """Test clearing all tokens."""
+@pytest.mark.parametrize("op", ["delete_one", "clear_all"])
+def test_delete_token(memory_token_store, token_a, token_b, op):
+    """Test delete_token removes only its host's token and clear_all_tokens removes every host's."""
     host1 = "https://api.anymoment.sineways.tech"
     host2 = "https://dev.api.anymoment.sineways.tech"
     
-    save_token(host1, "token-1")
-    save_token(host2, "token-2")
+    with transaction() as tokens:
+        tokens.update({host1: token_a, host2: token_b})
+    # Check the write in the store itself rather than decrypting it back
+    assert memory_token_store["index"].keys() == {host1, host2}
     
-    clear_all_tokens()
+    if op == "delete_one":
+        delete_token(host1)
+        remaining = {host2: token_b}
+    else:
+        clear_all_tokens()
+        remaining = {}
     
+    assert memory_token_store["index"].keys() == remaining.keys()
     assert get_token(host1) is None
-    assert get_token(host2) is None
+    assert get_token(host2) == remaining.get(host2)
 
 
-def test_expired_token(mock_token_file):
+def test_expired_token(memory_token_store, expired_token):
     """Test that expired tokens are not returned."""
     host_url = "https://api.anymoment.sineways.tech"
     
-    # Create an expired token
-    exp = datetime.now(timezone.utc) - timedelta(hours=1)
-    expired_token = jwt.encode(
-        {"sub": "test@example.com", "exp": exp.timestamp()},
-        "secret",
-        algorithm="HS256",
-    )
-    
     save_token(host_url, expired_token)
     retrieved = get_token(host_url)
     
     assert retrieved is None
 
 
-def test_valid_token(mock_token_file):
+def test_valid_token(memory_token_store, valid_token):
     """Test that valid tokens are returned."""
     host_url = "https://api.anymoment.sineways.tech"
     
-    # Create a valid token (expires in 1 hour)
-    exp = datetime.now(timezone.utc) + timedelta(hours=1)
-    valid_token = jwt.encode(
-        {"sub": "test@example.com", "exp": exp.timestamp()},
-        "secret",
-        algorithm="HS256",
-    )
-    
     save_token(host_url, valid_token)
-    retrieved = get_token(host_url)
+    # The epoch exp stored at save time is compared directly; the token isn't decoded again
+    with patch("anymoment.token_manager._jwt_exp", side_effect=AssertionError("decoded")):
+        retrieved = get_token(host_url)
     
     assert retrieved == valid_token
 
 
-def test_permanent_token(mock_token_file):
+def test_permanent_token(memory_token_store, permanent_token):
     """Test that permanent tokens (no exp) are returned."""
     host_url = "https://api.anymoment.sineways.tech"
     
-    # Create a token without expiration
-    permanent_token = jwt.encode(
-        {"sub": "test@example.com"},
-        "secret",
-        algorithm="HS256",
-    )
-    
     save_token(host_url, permanent_token)
     retrieved = get_token(host_url)
     
     assert retrieved == permanent_token
 
 
-def test_list_tokens(mock_token_file):
+def test_list_tokens(memory_token_store, valid_token, expired_token):
     """Test listing all tokens with their status."""
     host1 = "https://api.anymoment.sineways.tech"
     host2 = "https://dev.api.anymoment.sineways.tech"
     
-    # Create valid and expired tokens
-    exp_valid = datetime.now(timezone.utc) + timedelta(hours=1)
-    exp_expired = datetime.now(timezone.utc) - timedelta(hours=1)
+    with transaction() as tokens:
+        tokens[host1] = valid_token
+        tokens[host2] = expired_token
     
-    valid_token = jwt.encode(
-        {"sub": "test@example.com", "exp": exp_valid.timestamp()},
-        "secret",
-        algorithm="HS256",
-    )
-    expired_token = jwt.encode(
-        {"sub": "test@example.com", "exp": exp_expired.timestamp()},
-        "secret",
-        algorithm="HS256",
-    )
-    
-    save_token(host1, valid_token)
-    save_token(host2, expired_token)
-    
-    tokens = list_tokens()
+    # Expiry comes from the exp stored at save time, without decoding the tokens
+    with patch("anymoment.token_manager._jwt_exp", side_effect=AssertionError("decoded")):
+        tokens = list_tokens()
     
     assert host1 in tokens
     assert host2 in tokens
     assert tokens[host1]["expired"] is False
     assert tokens[host2]["expired"] is True
+
+
+def test_transaction_updates_and_removes_in_one_write(memory_token_store, token_a, token_b):
+    """Test a transaction applies sets and deletes together and writes nothing if it raises."""
+    host1 = "https://api1.anymoment.sineways.tech"
+    host2 = "https://api2.anymoment.sineways.tech"
+    save_token(host1, token_a)
+    save_token(host2, token_a)
+    
+    with transaction() as tokens:
+        assert tokens == {host1: token_a, host2: token_a}
+        tokens[host2] = token_b
+        del tokens[host1]
+    assert memory_token_store["mtime"] == 3
+    assert get_token(host1) is None
+    assert get_token(host2) == token_b
+    
+    with pytest.raises(RuntimeError):
+        with transaction() as tokens:
+            tokens[host1] = token_a
+            raise RuntimeError("abort")
+    assert memory_token_store["mtime"] == 3
+    assert get_token(host1) is None
+
+
+def test_transaction_keeps_entries_it_cannot_read(mock_token_file, token_a, token_b):
+    """Test a transaction leaves entries encrypted with another key on disk as they were."""
+    from cryptography.fernet import Fernet
+    
+    foreign = {"token": Fernet(Fernet.generate_key()).encrypt(token_b.encode()).decode(), "expires_at": None}
+    mock_token_file.write_text(json.dumps({"https://foreign.example": foreign}))
+    
+    with transaction() as tokens:
+        assert tokens == {}
+        tokens["https://a.example"] = token_a
+    
+    stored = json.loads(mock_token_file.read_text())
+    assert stored["https://foreign.example"] == foreign
+    assert get_token("https://a.example") == token_a
+
+
+def test_fernet_key_derived_once(memory_token_store, token_a, token_b):
+    """Test the encryption key is derived once per process, not on every save or decrypt."""
+    _get_fernet.cache_clear()
+    with patch("anymoment.token_manager.hashlib.blake2b", wraps=hashlib.blake2b) as blake2b:
+        save_token("https://api1.anymoment.sineways.tech", token_a)
+        save_token("https://api2.anymoment.sineways.tech", token_b)
+        _invalidate_cache()  # force a decrypt of both entries
+        assert get_token("https://api2.anymoment.sineways.tech") == token_b
+    assert blake2b.call_count == 1
+
+
+def test_tokens_cached_until_file_changes(mock_token_file, token_a, token_b):
+    """Test repeated lookups are served from cache until the file is rewritten."""
+    host_url = "https://api.anymoment.sineways.tech"
+    token1, token2 = token_a, token_b
+    
+    save_token(host_url, token1)
+    assert get_token(host_url) == token1
+    
+    with patch("anymoment.token_manager._read_index", side_effect=AssertionError("re-read")):
+        assert get_token(host_url) == token1
+    
+    # Writing through the module invalidates the cache
+    save_token(host_url, token2)
+    assert get_token(host_url) == token2
+
+
+def test_import_does_not_load_crypto():
+    """Test importing the client and token manager defers jwt/cryptography until needed."""
+    code = (
+        "import sys, anymoment.client, anymoment.token_manager; "
+        "print(any(m.split('.')[0] in ('jwt', 'cryptography') for m in sys.modules))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
+
+
+def test_legacy_token_file_is_migrated(mock_token_file, permanent_token):
+    """Test tokens encrypted with the old PBKDF2 key are read and re-encrypted with the current key."""
+    host_url = "https://api.anymoment.sineways.tech"
+    token = permanent_token
+    legacy = _get_legacy_fernet().encrypt(token.encode()).decode()
+    mock_token_file.write_text(json.dumps({host_url: {"token": legacy, "expires_at": None}}))
+    
+    assert get_token(host_url) == token
+    stored = json.loads(mock_token_file.read_text())[host_url]["token"]
+    assert _get_fernet().decrypt(stored.encode()).decode() == token
+
+
+def test_legacy_migration_keeps_other_entries(mock_token_file, monkeypatch, token_a, token_b):
+    """Test migrating a legacy entry leaves undecryptable and keyring-backed entries on disk as they were."""
+    from cryptography.fernet import Fernet
+    
+    monkeypatch.delenv("ANYMOMENT_TOKEN_STORE", raising=False)
+    legacy_host = "https://a.example"
+    foreign = {"token": Fernet(Fernet.generate_key()).encrypt(token_b.encode()).decode(), "expires_at": None}
+    in_keyring = {"keyring": True, "expires_at": None}
+    mock_token_file.write_text(json.dumps({
+        legacy_host: {"token": _get_legacy_fernet().encrypt(token_a.encode()).decode(), "expires_at": None},
+        "https://foreign.example": foreign,
+        "https://keyring.example": in_keyring,
+    }))
+    
+    assert get_token(legacy_host) == token_a
+    stored = json.loads(mock_token_file.read_text())
+    assert stored.keys() == {legacy_host, "https://foreign.example", "https://keyring.example"}
+    assert _get_fernet().decrypt(stored[legacy_host]["token"].encode()).decode() == token_a
+    assert stored["https://foreign.example"] == foreign
+    assert stored["https://keyring.example"] == in_keyring
+
+
+def test_clear_all_tokens_repairs_corrupt_file(mock_token_file, permanent_token):
+    """Test clear_all_tokens overwrites an unreadable token file instead of raising."""
+    host_url = "https://api.anymoment.sineways.tech"
+    mock_token_file.write_text("{not json")
+    
+    clear_all_tokens()
+    assert json.loads(mock_token_file.read_text()) == {}
+    save_token(host_url, permanent_token)
+    assert get_token(host_url) == permanent_token
+
+
+@pytest.fixture
+def memory_keyring(monkeypatch):
+    """In-memory keyring backend, active with ANYMOMENT_TOKEN_STORE=keyring for the test."""
+    keyring = pytest.importorskip("keyring")
+    from keyring.backend import KeyringBackend
+    
+    class MemoryKeyring(KeyringBackend):
+        priority = 1
+        
+        def __init__(self):
+            super().__init__()
+            self.store = {}
+        
+        def get_password(self, service, username):
+            return self.store.get((service, username))
+        
+        def set_password(self, service, username, password):
+            self.store[(service, username)] = password
+        
+        def delete_password(self, service, username):
+            del self.store[(service, username)]
+    
+    backend = MemoryKeyring()
+    previous = keyring.get_keyring()
+    keyring.set_keyring(backend)
+    monkeypatch.setenv("ANYMOMENT_TOKEN_STORE", "keyring")
+    yield backend
+    keyring.set_keyring(previous)
+
+
+def test_keyring_token_store(mock_token_file, memory_keyring, permanent_token):
+    """Test ANYMOMENT_TOKEN_STORE=keyring keeps secrets in the keyring and only the index on disk."""
+    host_url = "https://api.anymoment.sineways.tech"
+    token = permanent_token
+    save_token(host_url, token)
+    
+    assert memory_keyring.store == {("anymoment", host_url): token}
+    assert json.loads(mock_token_file.read_text()) == {host_url: {"keyring": True, "expires_at": None}}
+    assert get_token(host_url) == token
+    
+    delete_token(host_url)
+    assert memory_keyring.store == {}
+
+
+def test_keyring_entry_without_keyring_store(mock_token_file, memory_keyring, monkeypatch, permanent_token):
+    """Test a keyring-backed host raises TokenError when the keyring store is off, and its entry is kept."""
+    host_url = "https://api.anymoment.sineways.tech"
+    save_token(host_url, permanent_token)
+    stored = mock_token_file.read_text()
+    
+    monkeypatch.delenv("ANYMOMENT_TOKEN_STORE")
+    _invalidate_cache()
+    with pytest.raises(TokenError, match="ANYMOMENT_TOKEN_STORE=keyring"):
+        get_token(host_url)
+    assert get_token("https://other.example") is None
+    assert mock_token_file.read_text() == stored
+    assert memory_keyring.store == {("anymoment", host_url): permanent_token}
+
+
+def test_keyring_backend_failure_falls_back_to_file(mock_token_file, memory_keyring, monkeypatch, permanent_token):
+    """Test a backend error that isn't a KeyringError (e.g. D-Bus) still saves the token, encrypted to file."""
+    def locked(service, username, password):
+        raise RuntimeError("org.freedesktop.DBus.Error.ServiceUnknown")
+    
+    monkeypatch.setattr(memory_keyring, "set_password", locked)
+    host_url = "https://api.anymoment.sineways.tech"
+    save_token(host_url, permanent_token)
+    
+    entry = json.loads(mock_token_file.read_text())[host_url]
+    assert _get_fernet().decrypt(entry["token"].encode()).decode() == permanent_token
+    _invalidate_cache()
+    assert get_token(host_url) == permanent_token
+
+
+def test_keyring_backend_failure_on_read(mock_token_file, memory_keyring, monkeypatch, permanent_token):
+    """Test the same backend error that saving tolerates makes reading treat the token as missing."""
+    def locked(service, username):
+        raise RuntimeError("org.freedesktop.DBus.Error.ServiceUnknown")
+    
+    host_url = "https://api.anymoment.sineways.tech"
+    save_token(host_url, permanent_token)
+    monkeypatch.setattr(memory_keyring, "get_password", locked)
+    _invalidate_cache()
+    
+    assert get_token(host_url) is None
+
+
+@pytest.mark.parametrize(
+    "token, expired",
+    [
+        (jwt.encode({"exp": 4102444800}, "secret", algorithm="HS256"), False),
+        (jwt.encode({"exp": 946684800}, "secret", algorithm="HS256"), True),
+        (jwt.encode({"sub": "x"}, "secret", algorithm="HS256"), False),
+        (jwt.encode({"exp": "soon"}, "secret", algorithm="HS256"), True),
+        ("header.!!not-base64!!.signature", True),
+    ],
+)
+def test_is_token_expired_reads_exp_directly(token, expired):
+    """Test expiry is read from the payload without pyjwt, treating undecodable claims as expired."""
+    assert _is_token_expired(token) is expired
+
+
+def test_token_expiry_is_decoded_once():
+    """Test a token's payload is decoded once; later expiry checks reuse the cached exp."""
+    token = jwt.encode({"sub": "cache@example.com", "exp": 4102444800}, "secret", algorithm="HS256")
+    _jwt_exp.cache_clear()
+    assert _is_token_expired(token) is False
+    
+    with patch("anymoment.token_manager.base64.urlsafe_b64decode", side_effect=AssertionError("decoded again")):
+        assert _is_token_expired(token) is False
+        with patch("anymoment.token_manager.time.time", return_value=4102444800):
+            assert _is_token_expired(token) is True
+
+
+def test_save_token_rewrites_only_its_entry(mock_token_file, token_a, token_b):
+    """Test saving one host leaves other hosts' ciphertext untouched and writes atomically."""
+    host1 = "https://api1.anymoment.sineways.tech"
+    host2 = "https://api2.anymoment.sineways.tech"
+    token1, token2 = token_a, token_b
+    
+    save_token(host1, token1)
+    save_token(host2, token1)
+    before = json.loads(mock_token_file.read_text())[host1]["token"]
+    
+    save_token(host2, token2)
+    assert json.loads(mock_token_file.read_text())[host1]["token"] == before
+    assert get_token(host1) == token1
+    assert get_token(host2) == token2
+    
+    delete_token(host2)
+    assert json.loads(mock_token_file.read_text()).keys() == {host1}
+    assert [p.name for p in mock_token_file.parent.iterdir()] == ["tokens.json"]